@@ -1,11 +1,16 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A3, landscape
 from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from PIL import Image, UnidentifiedImageError
 import re
 import io
 import os
+from itertools import groupby
+from functools import lru_cache
 from datetime import datetime
 
 # --- UI CONFIG & DIRECTORY SETUP ---
@@ -31,7 +36,36 @@ PAGE_MARGIN = 20
 SAFETY_OFFSET = 42.5
 FIXED_GAP = 33
 PAGE_SIZE = landscape(A3)
+PAGE_W, PAGE_H = PAGE_SIZE
+# Footer grid: an info column of 1/15 of the usable width, then 7 equal boxes (fixed for the page size)
+FOOTER_Y = PAGE_MARGIN + 60
+FOOTER_W = PAGE_W - (2 * PAGE_MARGIN)
+INFO_X = PAGE_MARGIN + (FOOTER_W / 15)
+FOOTER_DIVIDERS = tuple(INFO_X + (i * ((FOOTER_W - (FOOTER_W / 15)) / 7)) for i in range(8))
+FOOTER_HEADERS = ("PREPARED BY", "CHECKED BY", "CHECKED BY", "APPROVED BY", "LOCATION", "STATION", "SIP", "SHEET NO.")
+FOOTER_CENTRES = tuple(((PAGE_MARGIN if i == 0 else FOOTER_DIVIDERS[i-1]) + FOOTER_DIVIDERS[i]) / 2 for i in range(8))
 ROW_HEIGHT_SPACING = 105 
+# Sheet rows are stored column-wise (struct of arrays): {column: [values...]}
+ROW_COLUMNS = ("Row ID", "Function", "Cable Detail", "Terminal Number")
+# Uploaded symbols are stored at most this many pixels per point of their drawn size (4 px/pt = 288 dpi)
+SYMBOL_PX_PER_PT = 4
+# Uploads above this many pixels are stored as-is instead of being decoded for the shrink/alpha pass
+SYMBOL_MAX_PIXELS = 4096 * 4096
+# Font states, set once per homogeneous batch of strings
+TITLE_FONT = ("Helvetica-Bold", 16)
+FOOTER_FONT = ("Helvetica-Bold", 9.0)
+HEAD_FONT = ("Helvetica-Bold", 10.0)
+CABLE_FONT = ("Helvetica-Bold", 9.5)
+TERM_FONT = ("Helvetica-Bold", 8.5)
+ROW_FONT = ("Helvetica-Bold", 12.0)
+
+# --- PRECOMPILED PATTERNS ---
+_RE_DIGITS = re.compile(r'\d+')
+_RE_SPLIT = re.compile(r'\s*,\s*')
+_RE_RANGE = re.compile(r'([^,\[]+)\[\s*(\d+)\s+TO\s+(\d+)\s*\]', re.I)
+# A last column containing any of these words is a terminal note, not a cable (matched as substrings, one scan)
+TERM_KEYWORDS = ("SPARE", "RESERVED", "NI", "E3", "TERMINAL", "BLOCK", "LINK", "RESERVE", "SP")
+_RE_TERM_KEYWORD = re.compile('|'.join(map(re.escape, TERM_KEYWORDS)))
 
 # --- UPDATED SAMPLE FILE CONTENT  ---
 SAMPLE_CONTENT = """SHEET: 15
@@ -61,172 +95,279 @@ C, NWKR[1 TO 2], RWKR[3 TO 4], SP[5 TO 30], 24C RR TO GOOMTY3"""
 
 # --- CORE FUNCTIONS ---
 
-def parse_multi_sheet_txt(raw_text):
+# --- HEADER LINE HANDLERS (KEY: value) ---
+def _h_sheet(meta, rest):
+    val = _RE_DIGITS.search(rest)
+    if val: meta["sheet"] = int(val.group())
+
+def _h_station(meta, rest): meta["station"] = rest.strip()
+def _h_loc(meta, rest): meta["location"] = rest.strip()
+def _h_sip(meta, rest): meta["sip"] = rest.strip()
+def _h_heading(meta, rest): meta["heading"] = rest.strip()
+
+_HANDLERS = {"SHEET": _h_sheet, "STATION": _h_station, "LOCATION": _h_loc, "SIP": _h_sip, "HEADING": _h_heading}
+
+def _expand_ranges(ranges):
+    """Column-wise rows for (rid, func, cable, start, count) ranges: one list.extend per column per range"""
+    cols = {col: [] for col in ROW_COLUMNS}
+    rids, funcs, cables, tids = (cols[col] for col in ROW_COLUMNS)
+    for rid, func, cable, start, count in ranges:
+        rids.extend([rid] * count); funcs.extend([func] * count); cables.extend([cable] * count)
+        tids.extend(f"{n:02d}" for n in range(start, start + count))
+    return cols
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def parse_multi_sheet_txt(raw_bytes):
     sheets_data = []
     current_meta = {"sheet": 1, "station": "", "location": "", "sip": "", "heading": "TERMINAL CHART"}
-    current_rows = []
+    # Terminal ranges of the current sheet; expanded to rows only when the sheet is closed
+    ranges = []
 
-    for line in raw_text.splitlines():
+    for line in raw_bytes.decode("utf-8").splitlines():
         line = line.strip()
         if not line: continue
-        upper_line = line.upper()
+        key, sep, rest = line.partition(":")
+        handler = _HANDLERS.get(key.upper()) if sep else None
         
-        if upper_line.startswith("SHEET:"):
-            if current_rows:
-                sheets_data.append({"meta": current_meta.copy(), "rows": current_rows})
-                current_rows = []
-            val = re.search(r'\d+', line)
-            if val: current_meta["sheet"] = int(val.group())
-        elif upper_line.startswith("STATION:"):
-            current_meta["station"] = line.split(":", 1)[1].strip()
-        elif upper_line.startswith("LOCATION:"):
-            current_meta["location"] = line.split(":", 1)[1].strip()
-        elif upper_line.startswith("SIP:"):
-            current_meta["sip"] = line.split(":", 1)[1].strip()
-        elif upper_line.startswith("HEADING:"):
-            current_meta["heading"] = line.split(":", 1)[1].strip()
-        else:
-            parts = [p.strip() for p in line.split(',')]
+        if handler:
+            # A new SHEET line closes the rows collected so far
+            if handler is _h_sheet and ranges:
+                sheets_data.append({"meta": current_meta.copy(), "rows": _expand_ranges(ranges)})
+                ranges = []
+            handler(current_meta, rest)
+        elif "[" in line:
+            # Only lines with a [N TO M] range yield terminals. Upper-case once; the split also strips spaces around commas
+            parts = _RE_SPLIT.split(line.upper())
             if len(parts) >= 2:
-                rid = parts[0].upper()
+                rid = parts[0]
                 middle_part = ",".join(parts[1:])
-                last_part = parts[-1].upper()
-                term_keywords = ["SPARE", "RESERVED", "NI", "E3", "TERMINAL", "BLOCK", "LINK", "RESERVE", "SP"]
-                is_cable = not any(key in last_part for key in term_keywords)
+                last_part = parts[-1]
+                is_cable = not _RE_TERM_KEYWORD.search(last_part)
                 cable_detail = last_part if (is_cable and len(parts) >= 3) else ""
                 
-                pattern = r'([^,\[]+)\[\s*(\d+)\s+TO\s+(\d+)\s*\]'
-                matches = re.findall(pattern, middle_part, re.I)
+                matches = _RE_RANGE.findall(middle_part)
                 for match in matches:
-                    func_text = match[0].strip().upper()
+                    func_text = match[0].strip()
                     start, end = int(match[1]), int(match[2])
-                    for i in range(start, end + 1):
-                        current_rows.append({
-                            "Row ID": rid, "Function": func_text, 
-                            "Cable Detail": cable_detail, "Terminal Number": str(i).zfill(2)
-                        })
-    if current_rows: sheets_data.append({"meta": current_meta, "rows": current_rows})
+                    if end >= start: ranges.append((rid, func_text, cable_detail, start, end - start + 1))
+    if ranges: sheets_data.append({"meta": current_meta, "rows": _expand_ranges(ranges)})
     return sheets_data
 
-def draw_page_template(c, width, height, footer_values, sheet_num, page_heading):
-    c.setLineWidth(1.5)
-    c.rect(PAGE_MARGIN, PAGE_MARGIN, width - (2 * PAGE_MARGIN), height - (2 * PAGE_MARGIN))
-    c.setFont("Helvetica-Bold", 16)
-    c.drawCentredString(width / 2, height - 60, page_heading.upper())
-    
-    footer_y = PAGE_MARGIN + 60
-    c.line(PAGE_MARGIN, footer_y, width - PAGE_MARGIN, footer_y)
-    total_footer_w = width - (2 * PAGE_MARGIN)
-    info_x = PAGE_MARGIN + (total_footer_w / 15)
-    c.line(info_x, PAGE_MARGIN, info_x, height - PAGE_MARGIN)
-    
-    remaining_w = total_footer_w - (total_footer_w / 15)
-    box_w = remaining_w / 7 
-    dividers = [info_x + (i * box_w) for i in range(8)] 
-    for x in dividers[:-1]: c.line(x, PAGE_MARGIN, x, footer_y)
-
-    headers = ["PREPARED BY", "CHECKED BY", "CHECKED BY", "APPROVED BY", "LOCATION", "STATION", "SIP", "SHEET NO."]
-    for i in range(8):
-        x_start = PAGE_MARGIN if i == 0 else dividers[i-1]
-        x_end = dividers[i]
-        x_c = (x_start + x_end) / 2
-        c.setFont("Helvetica-Bold", 9.0)
-        c.drawCentredString(x_c, footer_y - 12, headers[i])
-        val = f"{sheet_num:02}" if i == 7 else str(footer_values[i])
+@lru_cache(maxsize=4096)
+def text_width(text, font):
+    """stringWidth with the result memoized (labels repeat heavily across a sheet)"""
+    return stringWidth(text, *font)
+
+def draw_strings(c, font, items):
+    """All (x, y, text) strings of one font in a single BT/ET text object instead of one per string"""
+    if not items: return
+    t = c.beginText()
+    t.setFont(*font)
+    for x, y, txt in items:
+        t.setTextOrigin(x, y); t.textOut(txt)
+    c.drawText(t)
+
+def _terminal_number(value):
+    m = _RE_DIGITS.search(str(value))
+    return int(m.group()) if m else 0
+
+def _sorted_groups(cols):
+    """Sheet columns sorted by (Row ID, terminal number) plus the (start, end) bounds of each Row ID; rows without a Row ID are skipped"""
+    rows = sorted((r for r in zip(*(cols[col] for col in ROW_COLUMNS)) if pd.notna(r[0])),
+                  key=lambda r: (r[0], _terminal_number(r[3])))
+    rids, funcs, cables, tids = (list(col) for col in zip(*rows)) if rows else ([], [], [], [])
+    row_bounds, lo = [], 0
+    for _, run in groupby(rids):
+        n = sum(1 for _ in run)
+        row_bounds.append((lo, lo + n)); lo += n
+    return rids, funcs, cables, tids, row_bounds
+
+def _symbol_path(code):
+    return os.path.join("symbols", SYMBOL_LIB[code]["file"])
+
+def symbols_signature():
+    """(code, mtime) of every symbol file on disk, so a replaced PNG invalidates cached drawings"""
+    paths = {code: _symbol_path(code) for code, sym in SYMBOL_LIB.items() if sym["file"]}
+    return tuple((code, os.path.getmtime(path)) for code, path in paths.items() if os.path.exists(path))
+
+def save_symbol_png(data, path):
+    """Write an uploaded symbol, shrunk to its drawn size and without a fully opaque alpha band (plain RGB, no soft mask)"""
+    sym = next((sym for sym in SYMBOL_LIB.values() if sym["file"] == os.path.basename(path)), None)
+    box = (sym["w"] * SYMBOL_PX_PER_PT, sym["h"] * SYMBOL_PX_PER_PT) if sym else None
+    try:
+        img = Image.open(io.BytesIO(data))
+        # open() only reads the header: check the size before anything decodes the pixels
+        if img.width * img.height <= SYMBOL_MAX_PIXELS:
+            shrink = box is not None and (img.width > box[0] or img.height > box[1])
+            opaque = img.mode == "RGBA" and img.getchannel("A").getextrema() == (255, 255)
+            if shrink or opaque:
+                if opaque: img = img.convert("RGB")
+                elif img.mode not in ("RGB", "RGBA", "L", "LA"): img = img.convert("RGBA")
+                if shrink: img.thumbnail(box, Image.LANCZOS)
+                img.save(path, format="PNG")
+                return
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError):
+        pass  # Not a readable (or too large) image: store the upload untouched, as any other file
+    with open(path, "wb") as f:
+        f.write(data)
+
+@lru_cache(maxsize=32)
+def _symbol_reader(path, mtime):
+    # Keyed on mtime as well: a replaced PNG is decoded again, an unchanged one only once per process
+    return ImageReader(path)
+
+@lru_cache(maxsize=1024)
+def _function_info(func):
+    """(symbol code or None, label text) for a Function cell; the first SYMBOL_LIB code present wins and is removed from the label"""
+    text = str(func).upper().strip()
+    code = next((code for code in SYMBOL_LIB if code in text), None)
+    return (code, text.replace(code, "").strip()) if code else (None, text)
+
+def _label_runs(labels):
+    """(start, end, text) for every run of equal consecutive labels in one chunk (at most one row of terminals)"""
+    runs, lo = [], 0
+    for txt, run in groupby(labels):
+        n = sum(1 for _ in run)
+        runs.append((lo, lo + n - 1, txt)); lo += n
+    return runs
+
+def draw_terminals(c, terms):
+    """Standard terminals for a whole page: all pins in one stroked path, all end dots in one filled path, then the numbers"""
+    if not terms: return
+    pins, dots = c.beginPath(), c.beginPath()
+    for tx, y, _ in terms:
+        y_top = y + 40
+        pins.moveTo(tx-3, y); pins.lineTo(tx-3, y_top); pins.moveTo(tx+3, y); pins.lineTo(tx+3, y_top)
+        dots.circle(tx, y_top, 3); dots.circle(tx, y, 3)
+    c.setLineWidth(1)
+    c.drawPath(pins, stroke=1, fill=0); c.drawPath(dots, stroke=1, fill=1)
+    draw_strings(c, TERM_FONT, [(tx - 8 - text_width(tid, TERM_FONT), y + 17, tid) for tx, y, tid in terms])
+
+def draw_label_runs(c, runs, font, is_h):
+    """Bracketed Function (above) or Cable Detail (below) labels: every bracket in one path, then the captions"""
+    if not runs: return
+    brackets, tick = c.beginPath(), 5 if is_h else -5
+    for s_x, e_x, y_line, _ in runs:
+        # Separate segments (not a joined polyline) so the corners render exactly like individual lines
+        brackets.moveTo(s_x, y_line); brackets.lineTo(e_x, y_line)
+        brackets.moveTo(s_x, y_line); brackets.lineTo(s_x, y_line - tick); brackets.moveTo(e_x, y_line); brackets.lineTo(e_x, y_line - tick)
+    c.drawPath(brackets, stroke=1, fill=0)
+    y_gap = 12 if is_h else -20
+    draw_strings(c, font, [((s_x+e_x)/2 - text_width(txt, font) / 2, y_line + y_gap, txt) for s_x, e_x, y_line, txt in runs])
+
+def new_page_cmds():
+    """Draw commands of one page, grouped by kind; filled by the layout pass, emitted by render_page"""
+    return {"images": [], "head": [], "cable": [], "terms": [], "rids": []}
+
+def render_page(c, cmds, x_rid):
+    """Emit one page's draw commands: one batch per kind, one font block per kind of string"""
+    for img, x, y, w, h in cmds["images"]:
+        c.drawImage(img, x, y, width=w, height=h, mask='auto', preserveAspectRatio=True)
+    c.setLineWidth(0.8)
+    draw_label_runs(c, cmds["head"], HEAD_FONT, True)
+    draw_label_runs(c, cmds["cable"], CABLE_FONT, False)
+    draw_terminals(c, cmds["terms"])
+    draw_strings(c, ROW_FONT, [(x_rid - text_width(rid, ROW_FONT), y + 15, rid) for y, rid in cmds["rids"]])
+
+def draw_page_template(c, footer_values, sheet_num, page_heading):
+    """footer_values and page_heading arrive upper-cased; they are built once per sheet, not per page"""
+    # Border, footer grid and captions never change: draw them once as a form and reuse it on every page
+    if not c.hasForm("page_template"):
+        c.beginForm("page_template")
+        c.setLineWidth(1.5)
+        c.rect(PAGE_MARGIN, PAGE_MARGIN, PAGE_W - (2 * PAGE_MARGIN), PAGE_H - (2 * PAGE_MARGIN))
+        c.line(PAGE_MARGIN, FOOTER_Y, PAGE_W - PAGE_MARGIN, FOOTER_Y)
+        c.line(INFO_X, PAGE_MARGIN, INFO_X, PAGE_H - PAGE_MARGIN)
+        for x in FOOTER_DIVIDERS[:-1]: c.line(x, PAGE_MARGIN, x, FOOTER_Y)
+        c.setFont(*FOOTER_FONT)
+        for x_c, header in zip(FOOTER_CENTRES, FOOTER_HEADERS): c.drawCentredString(x_c, FOOTER_Y - 12, header)
+        c.endForm()
+    c.doForm("page_template")
+
+    c.setFont(*TITLE_FONT)
+    c.drawCentredString(PAGE_W / 2, PAGE_H - 60, page_heading)
+    c.setFont(*FOOTER_FONT)
+    for i, x_c in enumerate(FOOTER_CENTRES):
+        val = f"{sheet_num:02}" if i == 7 else footer_values[i]
         y_pos = PAGE_MARGIN + 30 if i in [4, 5, 6, 7] else PAGE_MARGIN + 5
-        c.drawCentredString(x_c, y_pos, val.upper())
-    return info_x
+        c.drawCentredString(x_c, y_pos, val)
 
 def process_multi_sheet_pdf(sheets_list, sig_data):
     buffer = io.BytesIO()
-    width, height = PAGE_SIZE
-    c = canvas.Canvas(buffer, pagesize=PAGE_SIZE)
-    fs = {'head': 10.0, 'foot': 9.5, 'term': 8.5, 'row': 12.0}
+    # Compress page streams regardless of the local rl_config defaults
+    c = canvas.Canvas(buffer, pagesize=PAGE_SIZE, pageCompression=1)
+    # Decode each available symbol image once per document, not once per placement
+    readers = {code: _symbol_reader(_symbol_path(code), mtime) for code, mtime in symbols_signature()}
+    # Layout is identical for every sheet: terminal slot x positions are computed once
+    term_per_row = int((PAGE_W - INFO_X - SAFETY_OFFSET - 40) // FIXED_GAP)
+    x_start = INFO_X + SAFETY_OFFSET + 20
+    slot_xs = (x_start + np.arange(term_per_row) * FIXED_GAP).tolist()
+    # Signature boxes are the same on every sheet
+    sig_prefix = tuple(str(sig_data[k]).upper() for k in ("prep", "chk1", "chk2", "app"))
     
     for sheet in sheets_list:
-        meta = sheet['meta']
-        df = pd.DataFrame(sheet['rows'])
-        df['sort_key'] = df['Terminal Number'].apply(lambda s: int(re.findall(r'\d+', str(s))[0]) if re.findall(r'\d+', str(s)) else 0)
-        df = df.sort_values(by=['Row ID', 'sort_key'])
+        meta, cols = sheet['meta'], sheet['rows']
+        rids, funcs, cables, tids, row_bounds = _sorted_groups(cols)
+        # Normalize label text and detect symbols once per distinct Function value (memoized across sheets too)
+        func_info = {f: _function_info(f) for f in set(funcs)}
+        active_codes = [func_info[f][0] for f in funcs]
+        func_labels = [func_info[f][1] for f in funcs]
+        # Cable Detail is hidden under symbols
+        cable_labels = ["" if code else str(cd).upper().strip() for code, cd in zip(active_codes, cables)]
+        # Parsed numbers are already padded; edited cells may not be
+        term_labels = [str(t).zfill(2) for t in tids]
         
-        f_vals = [sig_data['prep'], sig_data['chk1'], sig_data['chk2'], sig_data['app'], meta['location'], meta['station'], meta['sip'], "AUTO"]
-        info_x = PAGE_MARGIN + ((width - (2 * PAGE_MARGIN)) / 15)
-        term_per_row = int((width - info_x - SAFETY_OFFSET - 40) // FIXED_GAP)
+        f_vals = sig_prefix + tuple(str(meta[k]).upper() for k in ("location", "station", "sip")) + ("AUTO",)
+        heading = meta['heading'].upper()
         
-        y_curr, rows_on_page, current_sheet_no = height - 160, 0, meta['sheet']
-        draw_page_template(c, width, height, f_vals, current_sheet_no, meta['heading'])
+        y_curr, rows_on_page, current_sheet_no = PAGE_H - 160, 0, meta['sheet']
+        # Layout pass: draw commands are collected per page and emitted by render_page before the page ends
+        page_cmds = new_page_cmds()
+        draw_page_template(c, f_vals, current_sheet_no, heading)
         
-        for rid, group in df.groupby('Row ID', sort=False):
-            terms = group.to_dict('records')
-            chunks = [terms[i:i + term_per_row] for i in range(0, len(terms), term_per_row)]
-            for chunk in chunks:
+        for g_lo, g_hi in row_bounds:
+            rid = rids[g_lo]
+            for lo in range(g_lo, g_hi, term_per_row):
+                hi = min(lo + term_per_row, g_hi)
                 if rows_on_page >= 6:
+                    render_page(c, page_cmds, x_start - 30)
+                    page_cmds = new_page_cmds()
                     c.showPage()
                     current_sheet_no += 1
-                    draw_page_template(c, width, height, f_vals, current_sheet_no, meta['heading'])
-                    y_curr, rows_on_page = height - 160, 0
+                    draw_page_template(c, f_vals, current_sheet_no, heading)
+                    y_curr, rows_on_page = PAGE_H - 160, 0
                 
-                x_start = info_x + SAFETY_OFFSET + 20
-                c.setFont("Helvetica-Bold", fs['row']); c.drawRightString(x_start - 30, y_curr + 15, str(rid))
+                xs = slot_xs[:hi - lo]
+                page_cmds["rids"].append((y_curr, str(rid)))
                 
-                # Pre-mark symbol positions for selective text rendering
-                has_symbol = [any(code in str(t['Function']).upper() for code in SYMBOL_LIB.keys()) for t in chunk]
-
-                for idx, t in enumerate(chunk):
-                    tx = x_start + (idx * FIXED_GAP)
-                    func_text = str(t['Function']).upper().strip()
-                    active_code = next((code for code in SYMBOL_LIB.keys() if code in func_text), None)
-                    
+                for tx, active_code, tid in zip(xs, active_codes[lo:hi], term_labels[lo:hi]):
                     if active_code == "@SP":
-                        t['Function'] = func_text.replace("@SP", "").strip()
+                        continue  # Blank gap: no terminal graphics
                     elif active_code:
                         # Draw symbol and hide standard graphics
-                        sym_data = SYMBOL_LIB[active_code]
-                        img_path = os.path.join("symbols", sym_data["file"])
-                        if os.path.exists(img_path):
-                            img = ImageReader(img_path)
+                        sym_data, img = SYMBOL_LIB[active_code], readers.get(active_code)
+                        if img is not None:
                             sw, sh = sym_data["w"], sym_data["h"]
-                            c.drawImage(img, tx - (sw/2), (y_curr + 20) - (sh/2), width=sw, height=sh, mask='auto', preserveAspectRatio=True)
-                        t['Function'] = func_text.replace(active_code, "").strip()
+                            page_cmds["images"].append((img, tx - (sw/2), (y_curr + 20) - (sh/2), sw, sh))
                     else:
-                        # Standard terminal rendering
-                        c.setLineWidth(1)
-                        c.line(tx-3, y_curr, tx-3, y_curr+40); c.line(tx+3, y_curr, tx+3, y_curr+40)
-                        c.circle(tx, y_curr+40, 3, fill=1); c.circle(tx, y_curr, 3, fill=1)
-                        c.setFont("Helvetica-Bold", fs['term'])
-                        c.drawRightString(tx-8, y_curr+17, str(t['Terminal Number']).zfill(2))
+                        # Standard terminal rendering (drawn with the rest of the page)
+                        page_cmds["terms"].append((tx, y_curr, tid))
 
                 # Labels: Hide Cable Detail if symbol is detected
-                for key, is_h, y_off in [('Function', True, 53.5), ('Cable Detail', False, -13.5)]:
-                    i = 0
-                    while i < len(chunk):
-                        if not is_h and has_symbol[i]: 
-                            i += 1
-                            continue
-                            
-                        txt = str(chunk[i][key]).upper().strip()
-                        if not txt: 
-                            i += 1
-                            continue
-                        
-                        start_i, end_i = i, i
-                        while i < len(chunk) and str(chunk[i][key]).upper().strip() == txt:
-                            if not is_h and has_symbol[i]: break 
-                            end_i = i
-                            i += 1
-                        
-                        s_x, e_x = x_start + (start_i * FIXED_GAP), x_start + (end_i * FIXED_GAP)
-                        c.setLineWidth(0.8); c.line(s_x-5, y_curr+y_off, e_x+5, y_curr+y_off)
-                        tick = 5 if is_h else -5
-                        c.line(s_x-5, y_curr+y_off, s_x-5, y_curr+y_off-tick); c.line(e_x+5, y_curr+y_off, e_x+5, y_curr+y_off-tick)
-                        c.setFont("Helvetica-Bold", fs['head' if is_h else 'foot'])
-                        c.drawCentredString((s_x+e_x)/2, y_curr+y_off+(12 if is_h else -20), txt)
+                for labels, key, y_off in [(func_labels[lo:hi], "head", 53.5), (cable_labels[lo:hi], "cable", -13.5)]:
+                    page_cmds[key].extend((xs[start_i] - 5, xs[end_i] + 5, y_curr + y_off, txt) for start_i, end_i, txt in _label_runs(labels) if txt)
                         
                 y_curr -= ROW_HEIGHT_SPACING
                 rows_on_page += 1
+        render_page(c, page_cmds, x_start - 30)
         c.showPage() 
     c.save(); buffer.seek(0); return buffer
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_pdf_bytes(sheets_list, sig_data, symbols_sig):
+    # symbols_sig is only part of the cache key
+    return process_multi_sheet_pdf(sheets_list, sig_data).getvalue()
+
 # --- UI LOGIC ---
 
 with st.sidebar:
@@ -241,9 +382,12 @@ with st.sidebar:
     with st.expander("📤 Symbol Library Management", expanded=False):
         uploaded_sym = st.file_uploader("Upload PNG library files", type=["png"], accept_multiple_files=True)
         if uploaded_sym:
+            # Every rerun sees the same uploads; only write the ones not saved yet so symbol mtimes (and caches) stay put
+            saved_ids = st.session_state.setdefault("saved_symbol_ids", set())
             for file in uploaded_sym:
-                with open(os.path.join("symbols", file.name), "wb") as f:
-                    f.write(file.getbuffer())
+                if file.file_id in saved_ids: continue
+                save_symbol_png(file.getvalue(), os.path.join("symbols", file.name))
+                saved_ids.add(file.file_id)
             st.success(f"Loaded {len(uploaded_sym)} images.")
 
     # Download Button for your NEW Sample Content 
@@ -260,17 +404,19 @@ st.title("🚉 CTR Generator Pro")
 uploaded_file = st.file_uploader("📂 Step 1: Upload Terminal List (.txt)", type=["txt"])
 
 if uploaded_file:
-    raw_text = uploaded_file.getvalue().decode("utf-8")
-    st.session_state.sheets_data = parse_multi_sheet_txt(raw_text)
+    st.session_state.sheets_data = parse_multi_sheet_txt(uploaded_file.getvalue())
 
 if 'sheets_data' in st.session_state:
     sheet_names = [f"Sheet {s['meta']['sheet']}: {s['meta']['location']}" for s in st.session_state.sheets_data]
     sel_idx = st.selectbox("Select Sheet to Edit", range(len(sheet_names)), format_func=lambda i: sheet_names[i])
     
     curr_rows = st.session_state.sheets_data[sel_idx]['rows']
-    edited_df = st.data_editor(pd.DataFrame(curr_rows), num_rows="dynamic", use_container_width=True)
-    st.session_state.sheets_data[sel_idx]['rows'] = edited_df.to_dict('records')
+    editor_key = f"rows_editor_{sel_idx}"
+    edited_df = st.data_editor(pd.DataFrame(curr_rows), num_rows="dynamic", use_container_width=True, key=editor_key)
+    # Untouched grid: the stored rows already match it, so skip the DataFrame -> lists round-trip
+    if any(st.session_state[editor_key].values()):
+        st.session_state.sheets_data[sel_idx]['rows'] = edited_df.to_dict('list')
 
     if st.button("🚀 Step 2: Generate PDF Drawing", type="primary", use_container_width=True):
-        pdf = process_multi_sheet_pdf(st.session_state.sheets_data, sig_data)
-        st.download_button("📥 Click Here to Download PDF", pdf, f"CTR_{datetime.now().strftime('%d%m%Y')}.pdf", "application/pdf", use_container_width=True)
\ No newline at end of file
+        pdf_bytes = build_pdf_bytes(st.session_state.sheets_data, sig_data, symbols_signature())
+        st.download_button("📥 Click Here to Download PDF", pdf_bytes, f"CTR_{datetime.now().strftime('%d%m%Y')}.pdf", "application/pdf", use_container_width=True)
\ No newline at end of file
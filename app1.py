@@ -1,242 +0,0 @@
-import streamlit as st
-import pandas as pd
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A3, landscape
-from reportlab.lib.utils import ImageReader
-import re
-import io
-import base64
-from datetime import datetime
-
-# --- UI CONFIG ---
-st.set_page_config(page_title="CTR Generator Pro", layout="wide")
-
-# --- EMBEDDED SYMBOLS (Base64) ---
-# Paste your Base64 strings here. 
-# To get these, use: base64.b64encode(open("file.jpg", "rb").read()).decode()
-SYMBOL_DATA = {
-    "FUSE": "iVBORw0KGgoAAAANSUhEUgAAAEsAAABOCAYAAABog+tZAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAHsIAAB7CAW7QdT4AADM9SURBVHhejbx5nBzVee/9rVNLV3dXL7OPZrTMSGgFCaEFxI4NGIjBEL8QO77xlps4603sm8Rxct/r+PNJbvzmvnFi+3qLEycQEyc2xGAWGzA7CAECoQ0tgPaZkWbv6bXWU+8fp6rVknHePPqUqqunuuqc5/zOc571aLPTXiylRAgBgJSSWIJuiPZ3gR+2r8MwJAxDdGFgWkb7N0KIdz27XhNdE0QSAGzbwjAEYah+V+6yaTZCZmbmODM5zsz0FJ6nbna9CnamTE9PmSVLltDX148QBkL3AfA91R7P8wiCgHK5SLFk47ZCXDdUL0wobQ/Q7p9pWEQyJPBDNKHu6bzvfNJ+HrM0AYahmOH7PoZhnMMsIQSWZf3cB6c0OzuFZdnk8zmKJQshDMIATp0aY/fufTz55JOcOHmY0xOzuE2BnVPPazQX0OlCGC65XIah4cVkrS4WLytzycZtrF49ytKlF1As5SCW+P7ZAQpDmZxVO23bxjAEUkIYhvi+j2VZbWb5vo+GaAPi5/UpYVYIKGaRjELnuZOZYRgSJ8/SBIDEMAT5vE0QSqan5iiVHIolm+qCz8JClaFFPQCcGpvm0KE9/OSxx3lp+0vMzc+xsLDAypUr6O8fYmjRErp6shjCVu+SLo26i+/FTJw+xVsHx6nUjmOZDt3d3fzt3/4N2y6/DNsWNJsuU5NVosjHsmy6u3OYps3k5ByaFpGxsmhCkMvZ1OsuuVwuQbjEc30iGWJZlupYQp3AEUKcy6zOKUQHdKNQtn+QPgQU8mxbUKnUmJ9foK+vm3KXQ3WhSb1eo5ArUewxWZjX2PnaszzyyI958qfPcOLkUQqFHNdedSv/9VMfYumSC+jq6sayNITIkLFDAl9DNyKiUCcMQ+rVkEp1msOH3+bggQO8c+QQL+3YzhWXX8ltH7iNy7ddwaLhLtxWxMJCDTtjUyzl8X1JdaGGYehYloXv+4Qh5HI2hmEQhhLXdZFStmdP2u9OhAkh0OZnvTgMz/0yPac/SGWUQtLZ+9S9ElD32XYOIaBarQPQ2+dw/NgU3/6Hr/Iv372PRrPKlVdezR133MZ7rruJvj6HVsOgWDYAgev67cFSDRVIGRJLQb5gYduCKIhZqHpMT0/xvvfdyOzcFFu3buMjH/kwt3/gNsrlIlJCtVoFdHr7SokMU1Ov3qgjNAPLsrAsqz0twzDENCxMy2gzKT2nPNHmZ5XMkvLsl510PhTPv3a9JuWSg501qC64zM1VGRrqByQ7d77K//nKP7Frzwv09HTzwQ/ewc03vZ8LL1qLlCH1WkguZ2FlBFEIrZYaGMMw0BAsVBeIkzkvZQSAaVoUnCJ2FqZnKmx/cQf/+m/38Nhjj3P99TfyW7/561x+xRVEUcD0VJVFi/qxbZtKZQEZx1imQRiCZVnt/vi+GiTTsNCNn5XdHcwKfkZmpZSOcicTwzBsI04IgWUZCZqqAAwu6mV8bIZ77r6HR3/yAIcPH+B919/FH372t9i0eSNnTi9Qr8/iOEWEbiAjjYyVQRPnjmT6TjurprqUUF3waTZbCKFhWRa9/Ta1hSYPPvg49/zz3zM9Nc+2bVfwoQ/dyabNG7GsDNWFGkLoGIaB73sYhtkGhhCCKJQEoVpdDcM4ZyHr1AqklOif++PPf0HTII7b/IAOCGqahmmaCCHQEMSxYlQcx2iahq4LdN2g2axTKvXiek2+/NW/5uvf+Do9Pd184xvf5Prrr2HxkhFMwyabtSmVS+i6SRAGaJrAMPR244UQxHFMHMcEQUCr5dFsBvi+RNeV3NF1HRnF6EIQBJK+vgG2XroVocFjjz3Ga6+/xvLlS1myeClSSoLQwyk46p1BgBDqfaofZ/spNB3D0AGIQkmMAoSmacRxjP6nf/L5L0RR3G5kJ6M6H6JpQAygmKQYpdNym8RxjJMt8PaR/Xz77/+OB+57hks2XcSnPvVrLB9dzbp1aygUs3iej+8HiATa2ayFEGogDN1ECK09EACOY2EYJlEk8Tw1VQBkFBPJECkjstks+XyecrmHvr4udF3n5MlTTEyMUyw5DC0aJpvNEoYRcaz6oyXCNx2UOFb9F0JrIzqK1AzSdR1dVwzU/+Rzn/+ClBGadpZZKTNS9AgRqxehoWkSKdULTNMkCgPCyGN6Zo6vf/3b/P3ff5utl27kC1/4H2xYv4lSqYydFTTqIVNTU4lSauK6Lp4XkslYgIaUEXEcE0WRUk1i8P0Q0DAMJZDTAdU0NZB+0ELTBFEkyWQEg4ODLFkyyuz8aZ5/bgdHjx3hwgvXMTDYj+8FBH5AJqOmYcosYg2hKUbRqS5FZ9+jaWoQ9T/+7Oe/ECXqddoYIQS6rrfRAzFSxui6eoGUMZ7nYRgCwzDwPI8fPnA/9957L5dcsoHPf/7PWLtm3dl7/YAolORydrLCRWiahmGYyfVZBVLJDI04VghLp0Hgh8QyJpNJpqGUECsZCjGeF+K2PPoGyqxcsZbZuUl++sSz1Osu5XIXK1cto9Xy0Q01ddP+CqG1xQBAFEUJohL0SYUyQMksIZTMOgvHc/UtBeGYIAiJY8jlLBoNF8PQ8D2ff/nevXzjG1/n2muv4Y8++zlWjK6gpy9HpdJUz4jVEKmR0pLpkMrJZNT0s3KLdNTPQblijmJkTBRK7KxJJpPBsgzCMMR1mxjoLFrcSz5XYG5ujudfeJpmM+DCdevJZDLohoaM1DO1BDrpOY7jNqLiOMYwjOS9GpqWLIGdyhgdq6CGOoQQ+H66YghcN8SyTCzL5pVXd/Bv//qvDA0P8IlP/CrrL1qNbgjqNRddE4l8UkcnpVMhfZc61HV6dLYnpdTcimSIYSiNWwiB49g4ToFYCCrzTVavWcMnPvGrrF17EYcOH+DBHz1AsZhn8sxk+1nvRjFnUU6qjCbtanehs0EpsmJkIkhDLEsghMQw1d8cx2Lvvj3cfc8/EYYxn/69z3HFFVsZG5uhWm1Sr3np05IXp6+SyXGWUSmFoWpoqiR2tonEvIrlub8LQ0m12sT3ZaJkSlyvRT6f49LLLuHWW99PGDX5x+/czeTUGXr7us955n9EnQAi7UHaqM5RTa8DPySSAVZGIKXA95Qt2Gy63HP3vTz77HN84pO/wo03XYnrBeTzGSxLkMvl8fxWgpZzXpdcn5UbulBa87sxSibmVtpoNXgSLXmW7/v4vovrqt8ZhgB0Zmfm0XW45eab+c1PfZr+gX7++A//nFpNWRf/GerkhYZAkMDufCa1bxKgC5MwUB4IUBrvM8+8wKsvH+bKK6/m1ltvIZ8tMj01S7HYRbFYRAgwzAzwH0/D80kk3oxcLodIlMOUQZ0jrRuCl1/ewXPPP83s7HRiBKsForvLQQidVlNi23m2bdvKnXfezhNP3ccTTzx1/ivPIZEsMp3AaWvynOdJOJ9plmWgiYharUbetrFtg4mJCR5++IcsXpbjYx/9JBkrT0xI3slSr1cRQjA1NUd3V7Fj+r07yWS6p6SMcwOnYCDEuUhP70+Zdvfd/8iXv/IlXnv9NQxDIwxDqtUqzWaIbedwvRa2bdHV1c2119xAV1c/f/Hnf9lG5X9EqSjqbJ+QUmIYFlpboIEQEk0EoLlomo9p6sSxTyuoEoaSx5/4Ca/sOMDFGzZw7XVb6elV1r5pWgShSxgFjIz2U61ViWRAJCMiGRETJUu1OoRQMqcTZa7rUq+7VOabSAnd3TmOHDlAs7nAQnWKYjlHb1+Ohx+5jxdefIHJM9McO3qCZquBZenEsY4MDWRoEHpq4eruydHb288nP/7rTM+e5Etf/gu6ekx8v042J5mvnMEP6hhG3BYPKakFzsAwrJTF7z4nNE0nCENiKcnl1ZQ6evQ4O3ZsJ5fr4uprrsBxupmfq1KpVDAMQSaTxW21OgT8WdI75qJSogUi0bPomILp6ixliO9HbN56KULo9Pf3Y+iSr3/9W7z66uuEUYuBwT4uWr8WoRk0mwFSRgRhh7YvIUpcMlddfQW/cMvtPPP0szz68JPqnbpFX18vbsvDSwzqn0eJgD/7RednTSgFzfN9dN3EdSU7X9vBm3tP8Z4bLuTCdRuI45BarYnnBWSsDLlsARnHuG6A0Cyl9aOhoSOlpsZK6MRSV68XaqzCRIh3Mmt6eo6x8ZPoekDGzjAxMcbf/d0/8JWvfJUHf3Rfu53DQ8MIoVGrVQCIZACAaZn4vmRhwQcEGzdu5jd+41Ps2fs6D/7oAXp6ugmDkGbTpdlsoCde1Z9H74IsCcTEcUQsdXQ9td00ZqZn2L17D72DBpds3IbjOEShwHEK5PNFpFSQtTMFbNtGCOWnSg8lnNWq2r6WECW601mEKdk0OjrEyMgK5mcbzM5M89hjT/CjHz3Ehz/0Ecqlbpx8gWazBoCV0bEsm0wmhwxBGAItWSBarQau61IsWVy4bgObN1/Km2/u5/iJo1SrFXwvZHTFCJGUtJrNDl6cSz8j6aQEKZX2bOgahq7cIaZpMzZ2jL1732T1qrWsWbkZ1wXfl5RLXRScIvW6S73WwjIUOpRtZyRHwiR5loEyVKpAKCVShkSJnqX0LUm16hKFLrt2vc69936Pu//pnwG4/oaruPHG99Hd00OpWMYwBZomME0LXQgM08AQAj2Z+qZpIqUkDCRWxuCO2+9k4vQpXn/9DRzHZnZ2Gq8VoAsd8zzXciclzFKyQ9HPzllNEzSbLd48cIjKfIW1ay+kp9/GEMotqwmJBvhuQBiE+ElnZRQjQ9QhAan8Uu0jeZ1ysBlt7TlMZE6r5bJv/2G+8a2vcc93/56LN27gm9/8Gi++uINXXn2ZZrPG+vWbGBwcSlbOmEhKZfgCERJdGORzDpZlIKVi3G23vp9G3efef/lniA0WDS0ijDx83yUMz40KdZISswmfUvUhVr4YAIIwpNVqcuz4O+zcuYOly5awedMWikVHTRsJrguuK7GsDJaVIQwlzWaIoZttfT1lTvoZqaagZggsw1IqSiLsZeKcKxSyAHSX+/n1X/09fv3Xf5VSqcg993yXyy7dRq3q0t/fw+BgL62maryMYgI/SORgQJToab6vprppWDhOkQ0b1nLi+EkOHnwLwxDMzlSxs9m2HvduJM6Ocoqoc282DQPfj3j77Xc4fOgYK1eOsmbtKmzbUr8RAt9rIZHYORvdABmGbbljiESZlRJ5ngmjBLqBnVMCPf1OoapJxjYZHR3mwx/+JX7tU59gdOQCHn/8p4yNH+NjH/8v1GoLDA0tBqBer2HbJkLXSF9pGCZRMkRRFNFsNjAMjYydYdvlV1Cvt3j8iZ+QyRjkHA3Z9r6owzCMc+KngiTYkJIQym+VkiYEmhZx6tQEjeYCS5YsxcmXCEPVMSEEMlIeAx3wXPUQ5QkAkNi2gZUEZAEsS5CxVANkYnuCxLSE8skn9zabHoaRZcvWS7AsnaPHTvD9H/wbF2/YzNq1qwFYt241YSBpNhvYtglIdKFkFICeyEdNi9TzTANdj7nmqmspd+V49dU3kBEU8r1EbZtTHYahVmfLMNDFWUGlggSJkkiCqCCx1VzX5+TJEwwM9rF61SrCUEVxpZREoY9tKxdJrdEg56jO+r6k3G2xUGmqUFOCXNUAgZbwLgyh1QyRUgUR0inY09NNLDWiMGCh4tJseNx//7+x89XX+MxnPoOGjpUx6O3tJYpDZBwBGradRGiQikmGwHVdoggcJ0cklcG9dt1a1q27iFpthlNj4+TyGXShwm4pgFLDPpRSMZIETXrb7lJattCV8A5Dn4XqHMePn2TF6CrWrluL0JUgtSyDjGVhWAIdiYwVSjzXxW02aDab9C8yEhUCnKKBZQnq9SbNZhOROA+V9aCMc/U3L4nlRVhWhkVDvezevZsHHvgRa9eu5r3vvZ4oClmxfAWO42AaBqaRTdCgbESBQqlhCIIgoKurSFc5z8T4BADlchdLliyl1fJ55+2jhMFZ56MSTcqJEIYhMgFQah62Qz5qCmqJ/RTitiImz8wwMT7GylXLWTQ42HbmCSFASObmZvBCD8fJI6WPbkCxnFXRXk8Shi6tVoNqrU69Xsf3A6SUuG6dakXpSVKGNBp1pIwpFpVgr9VqiQric//99wPw2T/6E3p6C5w5M8Pw4sXU63VM06KnpxspJbOzM7hug0iGVKs1mg2VB+G6IbV6i7m5WeZmF9A0wejISsJAcuLkMaJkTVOAUchKDXiZXCfTUHSE5BNZEqslNJIBx469Q7NVpVzuAhTiYgmBqxyCnucipZu4cSKEAKdgoQuYnp7DMAS6IZmZnmFhoYJtm1iWgee5CINEpqn3GoZONmvhBy103cKydB544Ee88OIL3HTTDVx9zWXousaLL75Ad1c/ejKdXc+nWq1QKBTp7S1gGALf9zB1nYJTpNVSaF66dDnjEyfI5UxGRpawUK1w7NgxMomcVDFE9UwFnoRFSjyoiyi5Q7k61I+UMgnT07PkskX6+vpwXRchDHQDWq5HLidYNNSHZZk0Gg1abo2p6XGOHR1jdn6SVWuG6e5x6OvpZmRkCT29RfygRbNZRwgdXZj4rkQIg0xGmRqNRshCpUEul6FWb3Hffd/Htg0+cNvthKHO1OQcvh9yzTXXUCx047k+jXodMMnlLKRUZku52I2ds8k7KgRnWTY9PQV0oZTm3t4estkMM9NzySKTUroqKi+p+kaq1VAIkEnmSco831PLv20r5vX1d9PfN4Tvh9i2Cn0DHDs2wYnjxzlw4DCHDr4JQLHQRanssGbNSt7cd4z77/93fvqkMlyLBYdKZQ4pIwqFLMdOHObU+NtUKmrK2YkbqLurTLPp8dBDD/LmgX0MDy9lzboVNOotgtDj/7rzdm6//Reo1uY4NTZOX38Pvb0ldr3xBv/+7w8wPTNFscug2axSqVTJ5XIATIzPMLykjyiEbDZHsVTEMHXqNQ8Z++RyGaRMvQ3JkaBL+L7KAxDJMimEyiwJQx2h2biuz9ipGXI5h8FFvVgZHRm7WBYML3PIZEO+9KW/4X/+2ef42y9/mXK5i6Hh3iRMBj957EF+//d/jz/4g8/x4ovPY2Y0env7GFzUw759u/nyl77F//rzL7Nr18u0Wi08V62eDz70AJ/7k0/zxS9+ESdf4Jvf/BpOvkg2r3HyxDiXb7uCP/iDz7FkeDmLh5eyUGnw9NM/5Ytf/CL/8J1vs337duZm60RxQBi2klW9gWGYxJGKgDv5IsNDw0xMjHFmcoJc1oFEbfJ8jygR7JE8m2bVRhMS4raRqwKOnuvTalUZHl7MokVDOE4W13WZmZllanKWKFAIm5upMzc3hSYiZmYqhKFkeqbCfKWCZTqgeZwamyAKYxqNOvV6kz27D/Pci4+wZ89+Xn11J67bIJuzEcJiyeIhpqbOMDc3z7JlI+gGZLMWjuOwdNkwmzZvYm5+Cj8MyWRNBga6qdaqTE1NMDd3hjOTY6CFmKZFd3c3tVodzwsIw4C8k2VqahbdDOkqL6JWr9FqNYmkAg7QjiOmfNEVvhJGJQHnmBAtcc8KAXPzCxw59hYApqm357ZTyNLdU2JmdoK5yhSGKdm79yBnJmZwWx49PQViGkxNzjA03EexWObY8bcByOdtPM9l7PTbWKbTTmDLZm0iGTAxcZwnn3qSVstnYKCHkZERSqUSAPV6nXu/+6+8tP1VDhzYjwx9xsePE0mXRqOJ24qYmpriyJHDBGGDen0B3YjQdRgY6EPKiIyVwfUWKDpdLF7SS3WhyszMLFEYEyW2YSqvpJSpjqoEvBACHUGU2GVaouoLYeC2XOZm6uQdG9OyiBFkc05bGD/6yBNMT81y5ZVXYpqC3XveoK+/hNAlO1/dxRu7X01WtyYvvPAClYryOZ06OcFbh99h+YrlOEWLtw6dYnJqHNNUofKZ6Tn6+4fo7ulh3/59TJ6ZotXysUyTvfv2Uu7KMTMzy6mxE7gtj0OH3ubpZ37KkmX9jIyMcujQAaanZ2m1ajRbDYLQpVjOUG/M4QcBGhZCh76+HoRm02o1MAzldRCJvtVJWqrBq4iIItmR1OX7ShcCqMxXOHTgMIcOHObE8bc5dOggu17fw+69O8lmLW6++SY8r8W3vvV1mq0GURRz+PBh3JbPpk1bGR1ZxcmTxzly5Ci6obFv/z7Gx8fo6SkxPLCGfW++xoEDBwDYuXMPO3fuIps16O4a4M39+zh16jRB6HHq1DiPPvII69ZdBMDxY2MsWTJMtTrPgQP76e9bxCWXbGRycopDB99mYLAfyzSZm5vl6NGjLCzUmJs/zdzcLG/uf4upMzUWDfUgNAvX9QiS+GgKIhWsUJ8NJa7OMislIZSvSjd0unsd3nnnKP/wne8wPj5GNmcR+AquR945wqbNmxgZXcbGjRs5ePAwCwsL2Jksr7++Cztrcdttt3D48Fts3/4CL7+8k6XLhtm58xUMU+eXP/xx5uaneO7FRzh+/DjT0zO8unM79eYMt932hxQKDrv3vMLY2Dhbtl7M068/j+u1uOvOu3j++ee4+55/4uprLmNycpaZmVkuvXQTg4OLeOXVlzhx4hhwHU899Rz33X8fGSuH5zcJ/JBmq0EYRNTqNcJA5X4JXSQWjAJQmGTStFdGJcyV7+cso9QkDYMAzw0w9Bwtt8H4+Bjj42PMzswlwrfCps2buOvOu+jr6+GWW34BgL173mRy6gxPPPEYAFu2bOLiizdiZQxee/0VPM9j3/59FJwCq1evZGCgm8GBpXhuxLGjpzh+/CROrpfFixcxOnIBTr7A08/8FMs0efjhhwEYGV3G+3/hNt5+5xD79x/ixIlj9Pb2MDi4iJHRZZSKZY4dO86pU+N873v/yvPPP8fRo28xPjbG1NQZalWFILcZUK1WaLbqGHpqevGuAPoPkSV0HcMQFIsFRkYu5JfuupMwcrHtnLL0W02KRYdVq1cAcOmlW7AyBi+/8gqnTo3jei0uu/QKrEyGVatXcPHFGzlwYD8njp+k2ayxetValq9YjGUJLr9iM2+9fYCMrVOrzbB16yaWjSzFyXez4oIV7Hp9F7vfOMCOl7czOrKCvr4ebr75Jp577ln27NnN3n17GR5ewoaLLySTyeAUChw6dICXd7zMjpe3c/HFG/mD//4ZbDtHqxlhmhph5PLwwz/huWdfQNfNdt+VEd3p5lYy/RwuyfMi0ikUJ8bHyDs2l2zayKWXXsH69RtYveYClixZxNp1a9q/37JlE0uXjrB//z4effQRAD7+8Y+1/37ZpduYmZnl4Yd/wsT4JPm8Q61WJWNbDA8Ps+Pl7fzwgfs4ePAwV1y5lXKpF0M32bhhK5ZZ4KUdL+J7Ibfc8n6KhQIjo8s4fXqC3bv3cuDAfkqlEqVSiWKhwGWXbmNycopHHn2U3t4err7qarZs2cTAYC9bt17MZdu2sH79Rrq6ytg5k3wui0jysJQhrXSrlCKlwSvS2wGFlLNK0DtOEcMUzM+2qFYbNJsetVqVMNTIZguYhoHruriuSy6fZ/Uq5YE8ceI41117PStWLAcgl82zedMWnHyBXbt2csHKC/jIR34J11VejfXrL+LCdeuxzBzd3V2Mjl6AZVlkbJOLL96MU7T44Q8fJJcr8It3/CJWJkOx6DC6fIR9+/dRKpa5+qqrcF0XPwi46qrLGRjoZ8+e3QCsv+hi/CAgk8lQT/S8ZsNjfr6C2wywbYc4VglynYA5hz+dXxiJVzBKTB/DEPT0lBkeXkzeMQiDENM0CPyYXN6kt6ebRsMnjjIsVJpEYcxHP/phRkZWcvr0BFs2b6Ont4vqgk8YSEZGR+ju6eHIO+N0dZVZsWI5Xd1FLNNs5yBMTc1w+eVX0VXuZuzUBEJINm/ezIrRVRw/foxioYuVK9diGAaZTIYPf+gjzM3OAjA6egGe5xGFMatWr2TNmnVMT08x0D/EyOhiLNNkcHAQ1/XxPZXDMTM9h2EKHCdLHEvCMEDKuO2m6aQ2syKUk7wTXalBGQSSyanTRDLAcbLYWR0ZQb1RZ3amSrnLYWTZKM1GyNipefbv34vvx1x66VZqCxG6MMnmcvT2djE8sIaMrdPftwgZCZKcMbZv386bB/YlQYj1jIwuxvM85ucb1GqKGZbpsGioh1qtxsK8R7OhArnHjh/BKRS4eMNGSqUSVsbC8zxq9SqlYjcbL9nIkiXDzM+1eH3nPmzbws4qN5DrNSgUinR1FwGIY/1nsgBT0uZnvRhU1MVMvKXK8SaxbZvjx4/y13/9V5w4OcZf/PmfsXXrFqq1urL9ogBim1arhWlm6O3LEUcxBw8dod6osXjRcvp6S8xWFmi1agz2DbLv4D7clkshN8yK1WViAvbu2ceX/uZvAbjt1g+yZctGRkdHcd2A7q4SlUqVU8fr1Jrj9Pb2ccHK5fiexMxAq1knCHymJmcplgrk8w6WlcHOmJwaO8mZ01MArF23hjDQ6BtwmJqcpbe7jyNHj/Gn/+NPMQzB33zpq5TLJZpNNQBCGG23lapR6piGMnGdkriYpZT4vktXVw8XXqT83bNz01RrFcIwImtnKBXLdPfY6MLCdwMmTi0wO+cxNDjCutWX0GgtML/QIGcXyJgq0WzxouVs2HAJF24YQgiThYUFvv/9+xkfP8X1730fd951K0uWDON5Loah02z61GpNBoYyrFlzISMjy2k2fAI/JPBCjh45ji5y9PX3k8+VEZqhQnDSQBcOy5aNMji4mFyuiO+7vHVoXBUnaCrVs9ms093dnfi/VI2SkcQ9NZGmGSg6T2dQ7hoSCIahRNME5XIfmua1jUzTVJUKM7NTHD82hZ3JMLSkhG1ncXI2YWJPDQwsRUY6lq0e6rtgWTlyOTtRej0OHTjCc889y7p1F3HHHbdjGVkMw2rndAohKJXKLBrsJ5ezE++BhyaU+3dgQEV3ZBTj+yoMr8Y8xClYGKYyW4QGxWKJgYFeWq0WcQTV6gKtVoRp2sg4JoyCtvWSHgk30v/TPyhEpU56EoQViwW6u/qpVV1mpurksiUVLDAdTKOInckDglYDhGFQb/pYhvKSCgGWbeC6qhbHsECImHpVeSNPHKny5FPKz7Vh/QZKpSJBoErjLLNIsVBEFzaaNJiebuK6EikFhsjQrKuVWdmogozlkLEcsnYJ11Vu5Fy2iIwM8vliEogxaDS8xF8v2bP7MKapsXTpMoSWwfc0ZEflWCrg0+iTUBfnSf3UFjIMDEOQzxuEYczht/fRbDUQIk5UC6EEpQDPVwuEZRggIPAlvh/iuyGOIzCtWOWi2qqKAQzmqu/wyqsvc83VN/Ge624g8FIDHmq1BrWqj+e7REgM00zCUhaGZSFEBsNQlROWZZHNWWQTr6jj5BNRAhlLZf/Mz9eo1xuUSgWGhxczN+txZvIUtVqVkWUXUCw6FIvZ//+IdEpxR5lGJwwHBvtZvXIDx4+f5PChQ0kuRKpeKC0uDH0QEtNQeZG+7xOFPoYBlTkfy85gCEGz0UIYUJlv8MqON5ibneWqq7dw0foNxMTIOCKMlL4ThD6+p/LiBQJTCHQ1FhhWOphqmqWKpJ+E6MJQtSEtwgwClVlTLBtKt6s02bN3L7ZdYPPmzaCd1dZ/Hp3LLFQgopNRrqscZFdfdwkT42McOHgY2860Ry5N5ADa0ed0dEzDws7ZzC9MJYhQSzVIDr75Ds+/+BSbNm9ixYo1yCjCskzCIEZGGtlsDtOwELqm/EpIAimJQkCIc94VhiGu6yahtAaNRqM9jcJQVanmcjlyuSxuU1KpVJiZO8LJE6dYs3od/f3duC2fZtP/zzOrk0S71jDEcXIsWzpKvapx6uSp5A6l4butQBU2GgYIiReGyORvatQlpVIZkARuSFexzOnxeR585LvMz1W45urrWT66DN+PMAwLP/CxbR3LUmXFlmVhpgm6SRwPVEpRurSjsr4giQ5pmkrqVTJYIS31wVcqTRwnxzNPb8dtCjZt3kC1Vse21fT/T01DhZSzsbJ0xDQBTiFHV1eJVWuHmTg9xtGjJ9qoiqSPIQSGlZYE+6pSzFD6WhiG9PUW8EMfL/SwcvDarhfZu/dNtmy5nEs2XkxXT7ntU9O1NNB51pCNO1zfMlWek5lAMrCmlQY7bGw70y6FSwfdc1VFWRhGCGHx6E8eYHC4yCUbLyYKY2i/91z53UltZp1/k2zbR0oOrVy5iq2bL+ON18bY+doOgCQoGmHaKgPG911ARaqFENQaM8o1PVcjDANydp6Z6So//emPOTNe5YYbbmD5ihEatRatposQMXknlxSbJ5nKYYhAZdoYlqGmn0rAafuZ0vamA0wyPX3fRxcGujCoLMzg+x7dPQWOHj3AxPg0a1avY/Hi5RQKWWZnFpAyxLbP9ZB2kiDhfiooA1+FwBxHuVd9P8TzJLlckauuvoJiV8Tu3XtYWKiSzdrouolhgGnRToITAgLfp1AoI6Wk0VQKpmXHPPnUT3hpx3auvGY9l122CSfv4PseWkd2cFpeQmfQN/W3CRSnEvd3+ht5XgFCSnlHMcrJdyf104LvfOe7NJpV3v/+91HucjAtFeJXD//ZZ6ToFOmHlM5qrEr30pMG1WsedtZmw4YLGR8fY3JyjGIx146zqYdqeJ5LrVolkiHlco5Wq0UU+ZTLOaam5nn8xy9iGlluufl2uru7abaa6IaJ49j4fsD8fDWJTaoa5raRkTCow0fZZk66IKX9kIlrHKCyUKenp5tszmJgoJ/Z6SrPP/8syxZvZu3aCxGaIJZaO60zXaze7bki/ZCOZLrKqX0RBBnbJpc3sLM6w0NLuHTrlRx7p872l7ZTqTQBlaXiumFbiDaaLpZlYJgC120QhhKhS7Zv386OV57lmmuu4/LLt4IWUa+1Ei+H8nb4vovv+1gZNVhJpsG7/+vIiU/RpaZfgO+rla1Rr5PLWbiui1OweOTHP+LEyaP84gffw/Bw4oHwo2RBOhc4KbUHpXM00hVOSkmz2Ww3RtUy2wwt6mHDhjX09Euefvo5jh57WzkIo5Bmq042LyiVHCxLhc+bDZ9s1qZQyHHm9CwP/+gxHMfh9ttvpru7TKsVYJgGvu9SrVWJiSkUCliWhdtSKkk7Gvxzzp2kmBUlNmUzcTH1Uqm4hGHE4UMn+dpXvk9Pdz93/OLtWBmDZtNNZpFiVOcK2/lcFNPOCkj1RTpHleLpui6nT09QrdbRTY1CoYc7PvAhqtUau17bSyQ9yuUiYeDRaoQIYagqdhMqlXmKxTKWleMnjz3Grj0vcMON72HLlsupVZsEgd9Go4xChNCxrExiNyo9KZVVUqpV8Jxzx6h3kmEY7Yi4ZdlIKRlcVOIb3/wqh9/Zzn/56F2su/ACKvMuUiZVvEl6eafhnNLPIEt9cfZO5dMRWJZNoaACnM1GiGVluO0D72egdykPPvR99u/bh2FIhNCpVudpNZtEcUAQQLOpTCOAY8ffpqenmxtvuJFyl43nt9A1kziWOE6hzTTXU0VLRmLQxlISp2k/Hf9Skh3CXR0aliUolQp4vsf8/DzlLodWAx584GG2bt3GB++4EylDpqensCyzvQ1DqpCfT+cgS0+0YYUodUOaPC+EpLc3j23bhKHEtjOUSt1cc+0VHDlylH+6+27Gx8+QsTMIoWNaqthbSlUEPjc3h2UJrth2NZ/5zGfYuHEjjYZHNpdD06Uq8NbPhsqjMCYIflaTPn/6nYO45CySogNQHhPbzmCaJjOTNb717f8DwK/910+xfPka/KQAxCnYxPhYlrIU3o3ayOKcRLb2EtleTZpNn7m5Js2mGnHb1gnDJpdedjEXXbSBZ555lldeeQVdCEqlnErezxgEoY9hxlQqNWzb4n3vu4m7fukOBhf10Gq5ZCyLMIzQNB2vFeB6yv1jmapQIU3KSFfA86dfZydUm9V1mo9aqVSws1As5Xhl50t89StfY+ull3DddddhWQbz8zUMQ2AYabxBBSvOHyQ6BqKtOggh2tp7+iPbtsnlckmup4K770c4jsPi4ZV89o/+O1u3buJb3/o6J8eOYNk6B948RLnsUKnMAyG9fV0YpqBerzMxVsX3YiwzT2XOxTILaGQwrRy5bBGBTRAmKXgS4hBCKdURKbNKEqIjEUJxUZ1VeqYQKrlX03wMIyaWkt279/C1r3+V7u5ufvnDH6dQyGIlelU2W8D3RKIyqBjE+YOR9hsSmZUenVxNteH0sG27nZKki5junixr163hve+9jsnJKb71zW9z8OBhVqxcgu+HVBdqytXcW8LzfObnK8zPzzI1Na88kpYqeYvDBDGhJJQKXTJhUoRUppQQWBkT01L2Xpw00zAMLEtV00uVZY7r+jQaAT29XYyNzfDlL/+/HD1ylN/+nd/kppveS7W6QLXqUiwWMQw9qQKBZjPdj+ZcZHWujuf8JeVgJwM79S/DMAh8SaOp3B29fUW2Xb6Nyy+/ikd//DBf/co3qC60yOVsiqUChmFx5vQsszPzyts5NIDj5FTAwLYAxZCzQlsiNAPD0tCEmloRklgoIZ8eAHHiBlKuYKGK232fMKnyn52Z56GHf8C+vYe58X3v4fYP3IZl6TQaHr4ftAc/7WcQBG10dtZedpL+2T/6v7+Q7t+QUnqTkhtxeyOIKIrwfQ/PC4hCjSiUdHcXWLJkCbt27eK111/FNC36+3vp7x/Ctm3iOCCXy+I4eXShU6+7KsFXU/s2GIaOrp/diUQToOs6cazem1bbqxBVBMQIoXYqiaIQP1DPsCzlNjIMQbPh8sMH7uO7dz/BhkuW8Zu/8bv09vWxUKnS01vGTDbWMAwDXVfp3KqP5jkV+Go/B7WtghAC/Y8/+z+/kDKns3Q/jmNiGScbX6T7OZzdzUPKCN+PyFgGQ8OD9PX1MzExwVNPPsP4+BnWr19DT08vuWwOiKnV6tTrDUAVceq6DrHy8YtkP4m00UocSIgThiQICkPlFEzJtjPYtoXb8pKiT0Gt1uTRHz/Egw8+gFOAT37817j8ikupLtRoNDx6erqwLINGw0XXdUxLIwgistkMug6+H6ltCRJVpHNvCf2P/vB/fEHB7uyeDukOGRCnGW7tHT2EdjaupjroY+g6y5cvZWTZCG+88Tq7d++j1XKxLIuenn6sjEUUxchIksnk8H2XubkKQeiTsUw0LfEwRBJdV6hR9qGObZuYpo5pmpimRSaTIZMxMU2DhYUaMzOzxJpPPudw6tRp7v/3H/Dggw+QyeT52Md+hfe891pMQyXlWhmTer2Grmfxfb8NClDvDENVeJCCJp1NmqZh6GY6DdVGD2oTHrVTSIogIWJieZZZcSwJgpAoihC62mEjiiIKBYfe3kWMji7n7bcP88QTTzA1NcPw8CJ6ewfI5/PJiGl4nodlGZS7HFxXNSaVGWqfGHXtuh5h8nwptUQM+LiuyvJrtuYpFooUcw779u/h29/+R3784x/T29vHxz76SW688TrCUHL69AyOk6VUcggCiesGZLNZgiDA9wOsRI2JIollZpL0dMWLdOHTdaGYlW6hkqIlvUEtnbHyWZkmmpasYDGYpkE+n6NQsKlW6yxUq5RKXaxYsZStWy9D6BoPPfQjnnvuWRYtGqS/b4BafZ583qHZmkdoFjJW2ctOMYOV1AT6yX4xXV0qZOZ6PqZp4TgZfN/HNA1M02By6iQrL1iFrlu8/c5hvvj//G8ee/xR1q9fz2c+/Rmuunob1QWX6kKdUjlPNptLUKI8qQoIiiEpKVmpSvBIZPc5n9MNElNKmZR+TlfETn+X2q3DaO8MOTU1qcp+MyaWZeI4BU6fnuTlV17g+z/4N97cf5gLL1rNb//m73LzLTfieS6NhkutVsdxSrSaTYTQcQp57EwG1/OoLlQxTAPTVO+IJYRRgJ3J4hQyREHMG7v38NBDj3DPPd/FcRw+8clf5vYPfJA4NrCzgp7uPixLR8aC6kLigMw5bSsl7WMnnX/dSdr0ZOtscWGnan/eOWVoek6/D0MfUKF+1/WZn5+jr7+HYjGL60oOHtzHv/zL97jvBw9Sq0/z/ltv5a477+Laa9+LbesEvkYur4xnz3NZqDSRcYxpWkxPn2FwYIhyVz5pHTTqTc6cmQPgVz76YSbGp3Ech0/9xq9yy8230NPb1y7dDUMNO2vh5HOAijirWXPWG9rJnPMZlYIlPWtTpxWzUrvofCYJARpGOxc8RZhMdvJoturk8w7dPTbNhmRubhrbzpPLZajWqgwO9hCEHj/4/g/5b//td3C9FgArL1jDjTe+jzvv/DCrVo1SLDpUKnVmZqbJZrMsGhzEyhjERFQXXBr1FlbG4NSpEzz68JO89PIzvPrq69z6/lv5y7/8Ir29vTRbVSrzLr29JWQsOT0xTYxHsdBFuVxWCcVuM6nR/tn+ysRp2Mmgzvu06clGHMuzZRedD0g/i2TjnjDZKFFPzAKl3atU6RhJvV5H1wV9fb0IIZmamqa/v4dDbx1gsH8xpXKO02cm+O3f+j1efvklensH8fwG5VI3a9euZfPmTaxdsx7HKaIJj8nJWaanp6lU5hkfH+fJJ59mYuK0KmnxQh544BFWrVyNYYXMzbjYWbWJoqFn8P2IUjGLbmrMTNdZWKiQdxwsUwV4362v73bdSdrU6VbcuSng+RxNkZQyS5yX9iyEwLbVrozNpqu097LB3EyTd955i0u3beDQgeOsXL2MffvepFh0WLZsGZVKhQcf+DEPPvgwx4+/zdTUFEEgMU2BlTHwPWU5eF6Lrq5+uru6mZoZZ2jREn73d3+HW2++jXzJZm62wdFjR7ls2wa8VkxlYQGhGdhZC0M3sLMmzYaqmQRYWKjQ1dV7Tvs7P3f2/XzSpidbsZXs3/luN6fMOasUKqhayf4Ls7MzdHWVyeUN3FaI0FXx5ZnTMxw79g5XXLWVJ3/6HDfe+F4ajSrVWg3bVoGOubkZ3JZSMuu1BidOnuTo0bcYGztDELiMjo7g+wHlchfXX3896y5coaokgggwmJmusmiozMJCC02LmJ+rUygUKBbz1Bt1Ws2QfF65mlRg2GRmZgbbds7pX3o+v+/nkzY92YrTeQrKIFV+ESApfTWS3NI0bytdCS3LYNcbb+DkCyxdupS5uUrb9tuzZxe6kWHRoj4OHjjIFVddxvTUDAB9/WpkdYHahyFSJb5+4mSyMioi47Y8/CBgfm6OgYEBliwZ5tSpcXbseI3bbruFeqPK0OAIp8aO8/LLrzA8NAJAvV4lY5usX38x2azNG7v2smTJEpYsGULGJC7rEMtKCzETpklAyPNWy5QniW0opURLdlLUNKVbCaFjmkpBjSI1PYNAmQK6bqLrGm4j5MWXniGWIX19A0xNjzE0NMj0VIXf//SnGR0dZmpqlh/++wNJMeQFlMo5MlYepE51oUWrJanXVejdzmYoFm0ytsHOV3bz+q43OD0xzlNPPcPU1DQjo8t4/PGn+e69/8zWLVv5q7/639x08w3c+917+cEPvs+ioX7y+Txv7H6dxx57jILTi2la/OC+7zE3U2fV6pXJ7nAmjVqLQjFPGGoEXogmDCIZt7NHI6m2l9E1A2IdDZ3/D/qqwqK4MB59AAAAAElFTkSuQmCC
-",    # Paste Fuse Base64 string here
-    "RELAY": "iVBORw0KGgoAAAANSUhEUgAAASoAAAGlCAIAAADCvix1AAADnklEQVR42u3ZwQmAMBBFQVfSf8vfmzdFxBgjMwWssPBIJJVkAUZYrQDkB/ID5AfyA+QH8gPkB/ID5AfyA+QH8gPkB/ID5AfyA/kB8gP5AfID+QHyA/kB8gP5AfID+QHyA/kB8gP5AfID+YH8APmB/AD5gfwA+YH8APmB/AD5gfwA+YH8APmB/EB+gPxAfoD8QH6A/EB+gPxAfoD8QH6A/EB+gPxAfoD8QH4gP0B+ID9AfiA/QH4gP0B+ID9AfiA/QH4gP0B+ID+QHyA/kB8gP5AfID+QHyA/kB8gP5hLe2pQVdkm7JK8dPppD25EsWoPRhXo3w+GFSg/GEZ+ID+QH/Ca1m/0lXcP+I0bTwBOP3D5BPkB8gP5AfID+QHyA/kB8gP5AfID+QHyA/kB8gP5gfwA+YH8APmB/AD5gfwA+YH8APmB/AD5gfwA+YH8APmB/EB+gPxAfoD8QH6A/EB+gPxAfoD8QH6A/EB+gPxAfiA/QH4gP0B+ID9AfiA/QH4gP0B+ID9AfiA/QH4gP0B+ID+QHyA/kB8gP5AfID+QHyA/kB8gP5AfID+QHyA/kB/ID5AfyA+QH8gPkB/ID5AfyA+QH8gPkB/ID5AfyA+QH8gP5AfID+QHyA/kB8gP5AfID+QHyA/kB8gP5AfID+QH8rMCkB/ID5AfyA+QH8gPkB/ID5AfyA+QH8gPkB/ID5AfyA/kB8gP5AfID+QHyA/kB8gP5AfID+QHyA/kB8gP5AfID+QH8gPkB/ID5AfyA+QH8gPkB/ID5AfyA+QH8gPkB/ID+QHyA/kB8gP5AfID+QHyA/kB8gP5AfID+QHyA/kB8gP5gfwA+YH8APmB/AD5gfwA+YH8APmB/AD5gfwA+YH8QH6A/EB+gPxAfoD8QH6A/EB+gPxAfoD84Ntav9FVZb/g9AP5AfID+YH8APnBzyTpm9/5B0B7R0o84PIJ8gPkB/ID5AfyA+QH8gPkB/ID5AfyA+QH8gPkB/ID+QHyA/kB8gP5AfID+QHyA/kB8gP5AfID+QHyA/kB8gP5gfwA+YH8APmB/AD5gfwA+YH8APmB/AD5gfwA+YH8QH6A/EB+gPxAfoD8QH6A/EB+gPxAfoD8QH6A/EB+gPxAfiA/QH4gP0B+ID9AfiA/QH4gP0B+ID9AfiA/QH4gP5AfID+QHyA/kB8gP5AfID+QHyA/kB8gP5AfID+QHyA/kB/ID5AfyA+QH8gPkB/ID5AfTGoDYdcYUtLHTIkAAAAASUVORK5CYII=
-",   # Paste Relay Base64 string here
-    "CHOKE": "iVBORw0KGgoAAAANSUhEUgAAAGwAAABYCAYAAAAQjRJ2AAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAHsIAAB7CAW7QdT4AAEntSURBVHhenb13tGRXfef72XufVHXr3tu3u293qxVaoRVaWUKxJQFCCQk8eGCMA+mZYCOM8XjsMc9jjHEgWhjevJl5M541DmAMlmdsMDkIgYSQQEJZauXUSd23b/dNVXXCDvPHb5+61Y1Ys9bbvU5X3apTJ+zf/qXvLxy1dMiHAHjvCCEAoLVGa00IAe89zsl3SinaoZRCKUViktHnPsi+3vvRZz/rVSs9eh9CwMXzj2/et9cj51JKYYyhaRqapsE5T5IYjElG+4xfZ3s/wOhYSq1eu/ceAjjv5Hq0QmuNMWZ0nNEcNAne+7HjK5JEj65v7FR4D+DlM1WNjjs+pyFeD0rmu73mdv6cc2RZJvcQFCaRfTQoQC5i/Ebbi1vd5PN2ElbfK5SWE7efM0aY8fc/RSy579G5x39DPOThn4AiXrjWGCOTq+OEEM/Rbu1no2sdm9TR+cYmbPw6j/w7IPMxOh5eCE4g0m/s4D+9ONrftcdTOt5/HO2ct0MpRZIkEBmh/U4tHQohEHcMCh8czrnRzXrvZXUGUHr1AkIIcdISjFF4L1zqnPupfRRxMuUFhVxsS58QIPgwurDRImm5YozDsizFWo9zFu89SZKglEbrEFd2JKqG4MF5O1q1LRepSMx2Ar33o/sFRhMFcoyAxzm5Tny8aB1QKIxWBITDZF/5p0K7Xz06Vzsn7Wt7/tG5ImMQZC46nQ5N04wkljFGCOaDTLJWGuss1lo5MDquLJlkbVZXLWMrUS4IQpzwI4mktUKWtwIVCB6MaT8RYgcfV6ByeK9GYvjw8yiyzOAsuEgdETUKlMe7KJ48qEQm11qHtRbv/Eg0tdfcXmPLPSquoCQxo3sEEc3td0RCBGQSvYsL3YOLCywQZHEA6EY+O0KljBNrnLMIgRBkvrI8iwyzuojV8kII1lmMNiitsNbSNJYQVkVAS0wdRVBLSIWmJfb4GNdPqIA28NxzT/L1r32bPXt30TQVRdHhjW/8RU47dRvaJHinqOuS//FX/x/T02t5w+vfiFIycUopnK/4/Oc/x86dL/Br73o3GzccM+LSuim57767+fa3v81w2CcEOPGkk7n26qs59tgTaRqHsx5tFAuL+/jLv/xL/s0b3si2084CFIGA946HH76Xe++7n6eeeozf/d33s27dBu65525uvfU7nHfe+UxNTeOcxZgEQuCb3/o6Z515Dq99zRvwTmG9iwomLiQUaFn8jBFt/JUxgsmforOUApOYEYOIznaohYP2cL4EnPMjgh25yltCGCOTOb5S2v2IFwwKbRy33PJtPve5v+Oee35MVVX4ICLqogsv5g2v/yVe/4Z/A8EwP7+PV119GVdc/go+/an/hDE5zjkADh3ax+vf8PO8uG8PH//YX/CGf/1LoMDakr/9zF/x+S/8HXv37GU4rElSRbc7wUUXXsR1176W17/+F6KYUXzr2//M+37rfXzojz7Mm9/0NkIAax133XU7n/jzD7Nr9y62bj2Zv/6rz9LtTvCRj/wZf/e5v2HDho0UeQ9jAtYJ1+zetZvZ2Q3c8p0fErxIpxCirkGhtIhqjuSiOD+tqBufw+BXDbAsy4RBlBoZWsmR1FZR9Hi/qofGx/hqeakx/r1WnmeefpKPfvTPeOGFXbzrne/g1NPORKvAgw/fz3/7r/+VfS/OcfU1r2J6cpbGDtmzZzfD4XAk6ryXa5icnOLSSy/jH27+e045+ZSosB3/659u5j//l/+I1gnve9/vYIxCa5jbP883vvV1HtvxSboTOa+54efRIbCwsMyhQwdZWlqOV+y59Xvf5pOf/Bj33vcTXvOa1/Lr73ovnXyS4GH7pdv5H3/137jwggs57bTTkQUfrUMTUCFKHBWEu4Lo+5EuGzM42ilTqv17dc7bEaLBMj6P44ySHPnDkTVyhIn8/2cMyj6f/vSneeDB+/m9f/9+fvX/+jXWrFkPwEUXXcqLe18kSXK5aQ29Xpfjjz8J4k3Jq7zpdLqceeY2vvrVaU49dRsQ2LnzeT73uc+idcIHP/BHXHHFVSgV8MFRlTXHn3ACv/m+G/nKV/+F6669gaxICEE4NoSGpqn41re/zqc+9Ul27HiU3/nt3+O1P/c6tp50qugtHeR4zvPGX/glTj/97Gh8KeEhHQhxYesADpFo4iiB9hCiyg/Ryo539TMXPFGlEA08IrfSMlNLsCO3doeftf2fRgiBpaVFvvLVL3HCCSfyy7/8Ftat24DWBqU069dv5H2/+Tv8xnvex8RED6VgenqKyy+7nMXFQ8zPz1GWfaqqT1UPmDuwj/vuuxeUJ8tylIIHHvgJ9z9wH1e96mquueZ6er1JirxHnk0ws2Y91157LZdf9nKef/4FBuUiGjXSiwcOzPPju+/ipps+zgMP3s/rXvfz/OqvvovTTj0DpTTOO7y3fO97tzEYDrCuQZuEJDEorYWTVUK325P7xcctiGGFx4cjfUtRNUTi/ay5VGMuSfxk9Nn4pz9F9XancUK1f/+fRgiBpq5YXFrglFNOYcPsJkJoV5aIh+OPP4njjz8RE83o4bDkmWee5sGHHuTG3/h13v6Ot/COd72Vd77rrdz4nl/j1ltvJQQnVquGxaUVBoM+xxyzmaKYIERzWCYHJiamufLKV/LYY49y2/dvjw6ucNi//Ms/88E/+g88/MjDeO9oGsv69bNEWRuv0zM/P4/3jj/50w/xjne+mbe/8y28451v4e3veAvv/c13c+DAXpyzWGflvlj1zfS4sRmdwPE5fql5VEp8tMNciyhaf4pg42P8YO37lzrBS43RiooXmWc5Sul4zXIzcigRLe1YWVni/gfuo6pqdu7cyc5du3n++efYtWsPTz31BHtf3BuPL8dpJ791K0COq5WR4wfNzMwaFhYOsXv3XgJuxGHPPf8szzzzDFu3biVNM+6884fs3ftCvL7o8yiN9TUAu3fvYdeu3fGanmXnrt08+eRjDMs+jW3w0d9rCSM6eHVxq8glssm1tmNcqrW/a7e4Byo60nqce8a38YONjyP//lnjsJUUHceAXFgLI4HnueeejPIdmgYGgz6nnnIaf/yhP+FjH/0oH/3wTXz4Tz/Ob73vtzDGYHQ2Oq4xq6sQQkQ9Wr8MfGi45557Rnv4wIjIaZrx6792Ix/76E2sXzfLvv0v8t//x18yHPZJEk2SaJTSGC3neO9vvI+PffSjfOTDn+ATH/skH/nwx/nTP/0I01PrRuBCCJGzRhMusN1oI4q6iICMj/H50lqLHhsbWslnup08eZUVqqIVI6ullb0hriLZRlwUAsGBc2G0CRqgmOytYdu2s7j33p+wc9dOlArRygKlHH/6Zx/kD/7g/+ZHP/pBxDLF4NmwYSNXXPFKLrn4ci655DIuvPASXvGKKynyTvT7WkdbJv+BBx6i31+SG9MakxiMgYPzB/nmt77JMcccw9lnnRcNBOGw1//rN/C2t72d7Ze+kk984pOccMKJ/MM/fJ4f3PF9tBGc0CQK5y0Al19+Bdu3v4Ltl17BpZe+kksv2c6ll1xBUXQgcr2KnNkuGgEMInGOgKnGCdZ+3s7n+N9y7CjqAa3UKmFWieNhJItlO3Kf8RHa/6Iy9VGHdDo9fukXf4mdO1/gAx94P/v27abfX2ZxcZ5HHnmIf7j589zxwx+wuLQoKImT42ZZGg2L1nH2zMzMcMIJJxFaggW44IILOOecc/n+97/Lf/rPn6LfXxpN1MLCQf7mb/+Kubn9bL/0cs444yycFTGaphmnnXYamzZuRinFK15+NVde+Srm5vbzpS99kYMH92O03FTLYQfm5uivrFA3KwwGy1T1MsPhgOFwWYgbCaWUXsUAW4B3TDeNE22cQK34CyEIyhPfy3GEYZyzYtYLEWQS2vdat6umPSHA6qoxOhECKY+PMro9uEaLTUvGv/q5n+euu+7kxRdf5Pf/4N+TpYJA79+/H2sbLrroEs495zw5R+Q+71e53HuP85Y873L11dfw2b/7ayDgHGw5bitv+pW38R//30/ymc/+DYuLy1xz9TWYRPPVr36Nr339y2zbdhZve9uvMtHtRdEleKcxuZjnzqO14Zd+8Vf4xje+yne/+20+/ekNfOAD/4E0zSJMBJ/69KfYuHF2hFGiBJEwJuPDf/YJiqI7mqORiPRhhL+u6qNxQsjruEE4klpj3NW+BzDv/70PfCjyyBEEWrXonGtXwqpfJq8BOadwo2Bu8rfsD91uj9NPP52LLr6Y5194Dq01aZrS6/W44YbX8uY3v5UtW07E+0DdDPnGN7/JUZuP4vrrX4P3gcZa4SoMu3c/x4/uuptf+7UbsdbhXOCYY47hpK0n4p3nllu+w/0P3MsPfnAb+/bt47xzz+Xd776RCy+4FG0S6rpmx2M7+M53vsW/ecMvsG3b6VjraRrL9PQasjTlJz+5mx07dnDGGWdz3HHH8cQTT/CTe3/C3r17eOaZp3nqqad4+umnePqpp3n66ad49tnnecub30xRdA+bN+8F7mo/a/XauOjzXgBkRipode7H9zvs80Pzw9Enq9/FWE9LFCcHVGqVE1fZXtPKwyPhl3aIOR3YufNZrAto48HDzMwMa2bWClLvPVVVce99P2Gi1+WsM89DEbDR8tLKsG/fbp559nmuuPxKmqYZLQprG/bs2c3TTz8VzWuYmpxiw4YNHHvsFtI0B8A5y779L/LYYw9z3nkXsGF2E01jqWuxBFdWFnjk0R1UZZ9t285my5Zj2blrJ4888hCJSUYLVCuBucDjLFx22eUkiRhDEj0QALqF4JIkEQsvwlHee6y1Yi9gon5rmeBwgh05IsHaHduPBQNzHnTUFyJHPc6K8pMLFGHYhhVkeIwxh/kR0agVhzKA0n4EcLbH9t7jnOhOuU5ZLCGKZ7kmsQzr2lLX4veAwpjWfBbCqyMtrIhrQogxNLHgQtQX1gqR5bsU5xqcC+R5ikJTVmU8rkxma/JrDXXdUNeCIeoY/DQxFBEIWGtHn7UECyF+rgUn9GOWs24t6kisIwmnFg6WocXG5IIANHVTUg4bklTHA4vMtdbhvSPLZNWOM9U4h7Wr5aVHQwhmJLtFPESfyigUsppliHYUHpaQj7WOphEAljjRAHrkqbZWrxKfTMtRBsMBxojPZrRuFUEUXwLEpmlKVQ0JIZBlBVprynJAO0ctUdsQjIRvmtFkvxQ3tfprfPJFOkSx58Nh0e72d+0+4/urxUO1RLvGdJdSmrIcUtcNeZFT5AlJCt6BdUK0LIscNDJWWm5BEOqXoFdrXHpvhTO0EhYGgvP4oEjSuMq8cFd7IOdaoiaHcUUrPoghiFaRGyOTJ6h5nAwt1pfzjGJhWsvWWI9WiiTVlENxgrvdDKUVw0Ezukch+Op81XVNWZYjrs2zjCQVghEn+qVEmyyASBgv89VKpjbg2jJAS1ilFKq/7INzHueayC0BaxvSNKGxDQRDUaRkhaEcWozWLC0PKIpUzhuDba3IkdWtMYlGt75HBElbULSp3UivtZMtUe1AUAGtlKz+sfuUa/MoVaCUrD6tiboWtPI01hO8BiVGSnveEBTeBxLTRofHREyUKs5JUDVJFGXpcA4mJgzaKIaDdlIlgi5ElmMGxOr0TmMMGJOhdaBpRGcWRcbKyoBer4PWjroOlKXoX+89xiRMThY0jTDB0lKfmZlJFhb6pGmc47GhlhebIA5vQwgKraGqaooi46GHH+KWW25h586dDAZ9BoNlehNTeJ8QqElMgbUlSaqxjZdXOxaJVUBosK7lFhmtdZSkq3rOGI0iYEyxuuNLjCRJ0AYMPXTSoBSyuGpFmh2+cFodKAHZI490xIj4ZPAp1i8TgiLPctI0oapsPKQssDSNhkUINLXCs4JWOUWRRqddARnWluRZh0OHFpnoZeJSWLB1l86EAMPnnnMeV139SjrFJBO9jBde2MPGjbMMBhV5LmpnfKilBRtE4YuICUEydzqdhG99+zt88qZP8eK+PYCcrOh0KYqU4bCP1gne2xhorEavSZKNxJ91LsI2Dc4pjAk4pwCL0TmoBkKK0mBMwOgO1lqSJHnJ1yxLozjKSBI5idaaupbft6Ky3Z8x3Xq4IfTSQ2uDczV1pelOaJLUUJVynHYYPU2S9fFO/EHnapQyhCBpCPgMk3gSM0Walwz6Fdoo6qEizT1Fp4ttGg7M7+d1/+oN3Hjju5mcnGbdugn27DnA5OT0GHx3+FCDFR+899S15HJ47/HB0+tl3PKd7/GX//UzvOJVF3HmmWeQphnGaKrSY8zIux3J49Fri1AgekkhpnBQ4wRb3V8Oo1ExKnykiG1fPeAtgvGZeBofCEFFztYoJazdKv32t4GAd6uW6Uu9tsk8kuQTyPOEJFHUtehP78Wa0yrHJA7vJPZmjEEbEZsBaCqN8xVapVhXRUxRxDMqkOcdnnvuKb76ta+z/ZLLectb38TKygobN6xjeWVIp9PBjKUPHkawlSVJEbDWUdc13nl0osjShC9+8Uv8l//83/mt3343N1z/WrI8I0sN/X5DmglJDlM0cYjlE1dbi1LT4mng28wjWtTAR10jv5VMJBGb46+gaJoWylklinCwEKzVjXC4paq0wjvx244k1CrBZF/nAhAi5CT6rapWuUz0mCJ4JXEyrUlTJbpXBbzTEvzEMRw6er0c5zzGaJyDxBgeePB+bvrkp9i69SR+4z3vYXFxhWOO2YC1AaUSnBMX5Mihq6oZOXFaK7QxFHlOnmWEYFhaXiBNcwKBprbUtZjUTWPHXg/frLVRFMoK997TWEtVlQyHQwb9kuGgkm1YUZUNVVVHn6ahPxgyGJQ/9ToYDBHx3VDXFcNhSVlWkqBiPbZx1LUcq6pqyrKiruUabeOoqpKyLKmqkqqqfuq1LOWY8pn8fjgUP6uqKobD4WH7DYaDqPsFDfKhwdoGayvKYc1gEJ17rakqi/fikrQLtyyHeO8wiabbzXFeMxzWKKVJf4b41gL2ErlFRIYxGp1Aloto63YKGHNw/09b01jqqsFZUfYiqlb1Ywg+iphVh9lZh7OWxjZY537mJr/1NI2Y9u3xlBanuzWJx01jMa1bh1rclvZ+V+9bgNtWnIpZLlubsDruAAs3y8RqraiqmqWlIcvLQ8qyXbxyb3UlKgcCTeNoGvE5VxYyvLco5el2J8hSybHMMslKe6mhtU5GF621QmlPCILT1XUJUbRIOrRcsFIJTe1EzmJoajFtRaQJYbWRrKEQPMGLGS/QliPLYggkUdGiimneMZSRpglFkZFnaRRrcvEycav+SmtiE6MKAR+d6jpySUVdV9R1Td2Mva/b7+pRoqa1UTJYG3HKmM8YiS/oR421Fc7VgIsQVRiTLIE0ySmKnDwvSNMkIioRstKtHycEM+kA5yxKhRjbU2RZLjq5WYUBxzdtVDrSHbJyYqQ4ynVjAmUpmcBKabyTVee9El9HGbIsI8tSCFCVNcEHsiwd5e/VTS1+XrCSQheXyAgsViE6kQ5i+GTk6zhH01Q410DwVJXF2taYEH1jrcdacVBFhwkRQ8z1Fz8pxPS9w10MkPOYCG+N+1kyuYKEBIaRS70sMuUEDSpLXMyULoqCNE2FC2nhqwzQJCanrgNpKtJGG0WS1SSpgSDnqUqLwlCWgRDEQSeYw161+BNCsFbptu+99ygtDuroOw8ExWSvg7WBum4A8bvKssTaBpNo0iyLq8pE5a3J0ow8z9E6ES6JnJKlKXmek41QAiFmCIEkMWSZQEFKq4h4CMHaiW1NYGMS0jSl08npdDp0OgVFkcffJ2RZEmNtsqWpbOOfdTodiqJDnhdyTqVijNDgvfiqcqy4SKM/1ukIZwGUQ1EHLVTmrcyZsz4u1dX59C7ENHePdR4XVUTwq/uOv8Z84iNGXIJa67h6Vs3hgISrk1SqOQQlET3Y6XaYmuqRphLKqOqKpqlHVpwxZiTq0iwlL+S16GR0OgUTvQ4TE53osGakWUZvssv09DTTkz06nS5rZrpMrcnoTRZMTOR0u0KYLJXVnecZ3W7BxESHiYmCbrcbiZaR5x2KvEOeZ+RZEYmUkWWGopPQnUgpOka2wpBlCUWRkhcZM2unmFk7xcREB+caBoM+1lq0ltSELJOMqhC8GB4xAdZbix3pUpmn1ooF4bR2ckM7wSNnJBJ37FUtHwqhcU0M3wcaW5KlKWma8fkvfIFPfOJjfPxjn+Saa66iLANaJ7gmEFQZFbKJOkQxLFd49JGHuO+++9nz4u5RerR3gSQVBa0UZFmH0Oo6LSKivUhALD4LSYJwa5JLHqH1ZGk+up0QiOJSwhxZpknSnCRZXYWtqCTIsQCMEU4lugxJolB0SXNPWQ5Hv8tSMUKCL8g6IupX+jW2sRx37LGcffa5HH30MXQ6E2R5QvCCLdaV+IIm0QSnMEkqjomyZJkBHE888Rh/+MEPcO555/I7v/07QAYkaBLR2F6u88gxyq0Hj9YSRMyzjDTN+Iebb+bDH/4wN/35X3DttVcxGDhUSAT8NHYk4+u6IUk0c3N7+bvPfY5vfOMbHJjfP0Kh60pqpKxtyNKMJCmo65owFjBNEoXWqfiCvo5xJ9A6I8uSGCWQBTM+kkRTVfVIf2mdkOeriTrehxGyn+cZdV2T5xlVJTEwgCxTKDo4X4+hIzVJIiIuMSkm0dRNTVOXdLs9tm/fzi//0q9w1lnnkecFIQgorpSKqQgSD0uSgkQnBBwhWNJMsM4nHn+cD/7RB3jZ+Rfy2//utwT1QfQdEi4kIqqHDbWyFELTHE6wJEnJ84QvfOEf+dM//TCf+oubuPba61hZadAqATRZrqjrGq0Vznk6nQTrKn54x4/Y++Je1q5dIzpQKZy1WF9TVQ1pktDtTGGjMQCglYkIvx6Z6kp5UJpEp1GnyQX7sXwSrQxJasT/aiq8E+NF6QSFGDcANprRrVjXRmNtg3cKbQKJMWhjqCuHDzVNHUDVEDLSTBJGJ6cKUpNTu5LFQ0MmpwpOOeU0jj3mBNI0i4HQJnK/lntSoJOcJDGSZOQtSaoIwfLY44/zx3/8h1zwskv4t7/9XhJTvCTBjgQQVH85hKZxhODQOlDVQrBOkfG5v/8Cf/ZnH+bTn/4U11x9DSsrFUolKGVIEvGFuhMZdWVpmorJyQlW+ss0TcPUZA/rPHmWoVSgthXOBtLMkCVdGudwjQCgIlZlhMh2Yj2uIiQauRcVYnGdhxC/b5qGcigxLIldKoJfJRgh4INmYqIYsbRvOdYEtJLwEcHggsVF/6nFBkPQWFuR6ATThl98zUR3gizLsVaqfqqqFqPLJKRJJtWhOhMRHASvTRLwvuGxx5/gT/5ECPbb/+430SoDMhQm6jlGFvs4wbSY0AoQTpHMWkk7Jpq8tlm1bFqp2jQNRScdgbwCwFqyLGdycgrnoapK+oM+hxbmqUoJ2Thn0UnANY66qWOZrYTp61r+1kYQlxDFWRMRkHI4pKqGLC2tsLi4wKDfZzBYoqr6oGISZ5D6riSVyswsTWMIpkIpRZpoEgMBS9PUlOWQsizp90tW+ssM+gMGw2VW+sv0B8s0jSVNjZj9RhJs0swwNTlNluUMBoK0tFanMYbpyQkmp3KqqsEDjXUCscbFIpCdjMSINS2uitxCkkoZLy9heMh6jHErsV50VMaioJVSKL0aLBS5AlmWMeiXlMOSIk/odHJCCPT7A+qmkcnKUowRPYby4lf5wHBY4UNDmkrCJhFdSLIErcSxDMEJl8SaK6UF5IUQjQvZrxxWOGdJM4nbJZlcv9YqWqMiApWC5eVFqqokeC8WZZGS5wVZLmZ6mogLkqbiFkx0JyjyFKMhy4RoxhiJVked1SIqokPle6U1YHBWJIiLwVhhjDinSsCJvGiLIaMPSZBixxBF4JH/+sshtNFc52qsG5KmEtv5+7+/mY9+9KN8/GM3cf311zIY1EACXpNknrKsmZoqMEYxGFYQYPfuFzi0sERRZFGeCxrgnUySmMKtZSmR5XblWSeFAkkqTmx7w3khZbIhQPCOvEgEYag9SgmO1zq+zjmp8IxF3N45rJXgI208LVZpNlYMjyzLSVNNVTYEAjr6jkpBXVnKqibPU7TW0QEPTEx02bx5M8Z0RAzqFAg0tokpBAn9fp9OZxLvPYnWKCOON8rx6KOP8sEP/iFXXvkKbrzxvdgmUBRdrIWi0PRXHOlhlaAyhGBWaoEDDU1TUuTibH7ms5/hYx+7iZtu+nNefd2rGQxqFCkhKEzisNYxNd2hKi3WNTTNkJtvvpmvfOWrlNXgsBOFsRyGPMuxVsBSFRLSTKNUirMVjQ0o7dAqxcW89jTJ8V72F52nyNIspiOIQVI3sq9IiVXxE8ZyJtrP5Jgpde3EdTAJExNyH8QUgjTVOOextqYsLdqsFt+lJuXCiy7iDa//RU4++bRRgFQCqYLmJCbBeU+S5j+DYI/xwQ/+Aa94xRXceONv4h1CsCaQF4ZyIOj+kUOLixJvcgSESh66pE8Hgm/ZNt6wIsZ4JM/DOY+Pq3zt2rVs3nwUxx17HEdtPIYNGzawYcMGNm7cOHqdnd3Exo1HyfcbZ1m7bh2z6zdwzLHHsGXLsRy18RhmZ9ezcePG0f6zs+tZO7OO6em1rF+/gXXrNrF23TrWzKxj7bp1h52nPdeGDRtYt3Y9m47axOZNx44+27BhA0cffTSbNm1kJv6+NznFzNoZZtbOsHbdGqanp+n1Jlm3fj2zs+tZt3b96vE3babXmwYCIUikQySGoC4o6axgXoJD2iFxOxmCgERt46UGfFzPjQ+1vBCClGh6wNHYkiLP0Cbhs5/9Gz7+8b/gE5+4ietf/WqGA4vSGoWh09UsLKxQFALQem9JEs38wXmWlxdj9lFJXYtxAhrbVGiToBDnVimwzrK8JNHb3uQEaWqi+BPDR6HJ80RQ7rpGJ0qMCpNiXUNViUHSiTkmzkOep9imobGOxCSkWUJTezrddNTtQCvDsCxxtiHPi1jyFNP4IjgrGKKKeZOQ5zlJkmAM5NkEk1M9tJb0BGM0WZaJL4aA2946ghJE6Kc5TETi9ksv48Ybb8SYjG63y7DvKIoU60dS/LChlg+FYL34YeCxriTPVgn2kY9+jE/e9Gmuf/UNI4JpEnTSIO6AIM2iRB3WiTff7XYpywF1XTM93UNpzcryCkolLC2tUFcVRadgZmYtTSPxpqIoMFrRWCudBYKLPmFG8IHhcMDSykFWllfodHps3LSOLC1Y6S+jlaYsa0yiSJOMsqzQJjA9tYYQHPv2HeTQoYMURYfpNZNMTU3hvacqK8EGc9G55bBGa8gycV/qpmYwqFheWqbb6dGb7JLlGYlOGQwH9FdqvJdqmCxLcdaRpQVJahgMyp8pEnfseIQ//MMPcsnF27nxxneTpgKjDVYsnSIjsOp7HkawpYMhOB9ACdGcr8mzhCTV/O3f/j0f/ehH+PM//yTXv/oGBoMY7o6+kcSfRNYqFahrizFSzFBWpWQ1GUmasdZxzz33sHPnTh59dAfLy8skScIJJxzP5Ze9glNPPYUQfaokSVheXmRyske32+HZZ3byxJOP8fjjO9i3bx8oz6H5ASedvIXX/avXsvWkrSwtD7CuJDEZKyt9pqa6GJOxsrLIY489yb333s999/2ENTMzFEXOueeey1lnnsVxx24hycDWiryTcWDuANPT06yZmeCRh57i/gfuY+/eFzlwYB/GJJx1xrmcdvrJbDvtdKxzLC9VWCtR505nAu8DRqVMTKYsHBySFZlE1RLxDSVuZ9nx2A4++ME/5PLtr+TG33gXWmV0Oh0GK5a8yHAxOj7ugwUC5vd/70Mf8kFiVaAgeElR04aHH36EO+74Iddddy1bt548SpgMQZxNb33swyE6znupfFdK+mOgoFN0eGHnLv7xH/8nX/nyV/nOd7+Ns47Z2fU899zz3HXXj3lsxxN0OilHbz5GfJnEkOeaXm+SZ55+hi/c/Hm+8fXvcN999zM/vx+jU3Y8toMnn3iGXbt2U3RyZmc3MjHRExA4MRiTcvDgAl/60pf53Oc+z513/pB1azeye/cu7rvvQZ584kkOHDjIpo1HcdRRmwnBkKaZuBgq5blnX+DvP/85vvzlr/LQQw8SgufOu+7g8SeeZqW/yFGbjmXjhlmUksiDawJJWqCUwTaeiW5C08RJ1uITtqlyIVjm9u/ne9//HiecsIWLL7kQpaQFU9M4tEloGitZXEf8M7///g99yAWEVVGEICFrYww7duzgtttu57rrruHkrSfHSKmArs4FTGJIkwQfJHAo/oVYaJ1uRtFJmJ+f55/+6Yt84QufY/Pmo7ni8iu44orLue7aazn++K2kWcr9D97LYzue5Nhjj+H4448HPFlasOPRHXz60/+RO+74IccedyxXX30d119/PZdfcQlnnH4mSWq46867eeaZpzn55JM45pgtlGXFRC/n8cef4q//+q/5+te+zXFbjuHKK6/kF3/xjZx33vmcf955DAc1d9/zE+bm9nH8li2sXbuOg/OH6HYLXnh+J5/85Kd45JGHueKKK7n6qqu56qpXsXHjBub27+fRRx5jcXGBE048kU7eI89znA0kaYoxmqZ2FHmCViLepa4bCFLo7rzlwNx+vvvd73HCicdx4QUXA1oCw43DaEkm1dHnHd/M77//Qx/yI4KJ3hCEPOWRRx/hBz+4nWuuuZqTt54cw9yRYNaT5SlKaeqmQqFJEiPOpLfoGDb/ly99hX/+4j+xefPR/NzP/TzXXXct207fRp4XnHbaqZy4dQvDQckdP7gDlOeMM7axdmYte/fu528/89fccsutnHnWGbz97b/KVde8gm3btrF23XpOPvkUpiYnWVg4xN1330NjG84+52yMSdizexc3/8+b+ad/+mfOOPMM3vOe93LRRReiFGw96WTOPfcsZmc38eQTT3Hr926h2+1yzjnnj5zrL37xy/zP/3Uz559/Hje++72ce+45zMxM87Lzz2d2/VE8/vjjPProDjZt2sRRmzZT5IWABUZTFBG10AZvxb9VY4FhbcTo2bdvP7fe+n1OPHELL7vgIsEftXCWMWKojHkho/HThn4cIWZSSSxMEHLxY4SLkjTmltcSYjeJJo0xsuUlgXTm9h/gttt+QFHk/Oqvvo2LLjqfY47ZTJok7Nt3gABsmN3EW9/6Vv7163+eH/7wTv7xH/8XS0tL3H3Pj7n9tju59NJLeec738nFF19IUwnAemDuIHnR4bTTtvHOd72da669hvvvf4Af/egu0szwjW9+i1u+810uuvhC/u2/fR9btmxhzZq1zK7fiNYJadblrLPO4i1veTOnn346373l+zz40H2sXTvDl7/yFf7h5s9yww038K53/jobNq5nOCzprwzJ8wkuueRiXvOaG1g7s4l/+PwXuf/Bn4ByGKNoqhiB0OLqWO9ARQjXC8EAtJJWRy89Vvdr/xp//ZkEk5B9LIGNgGEr7rSWogHvPU1E3AUZkCWRZhlLi4t85jOf4a4f3cU111zLpdsvYvOmo0iShDTLmJlZG1eeZnpqmje96U1cdNGF/PjHP+b7t93OV77yJQaDkje+8Y2ce+75dLsdQlA0jaPT6bK0uITShqOPPp7XvvYGZmamuPOHd7Fv3z5+/OMfsXnz0bz62us54/QzKYcDut0Oa9fPUJYl8wfm8cGy/ZLt3Pju36A7UfDdW27he9/7AV/72jeYnp7hjb/wC5xy8qn0egWdTsHU1BTLSwOyPOeaa67h9W94LYvLh3h0x0PUdUlvsoMLDcNBRfACqyWpwcQ6ZwnitlEDfVisq8UJ2/ft3z8FS40Aw5cYUs8s0WLJViJyV8w68uCtjyZwhnOeqqpJ04Rut8MDD97P7bffzgUXnsf1N1yLVinDqmQwKAlegoaD/oBuN0cbzfHHb+GSS67g4MF5vvjFL/Pcc89z5ateyfnnn0NVDjk4vxR9RcXU5BRNLQkyVTXkvPPP51WvuoYnnniaP/7QH3Pvvffzyle+nAsuuIgsT1i7dh2D/pBDB5clOp1lJEnKRK/g4ksu5OUvfzn33PMT/uRP/oj5Awd506/8CqdtO43BcCDTpBWdTo8kEbC711vDBS/bzhlnbOW+ex/gySefIE0VeZbFjnSWEBqMkeIK4ShhAKKk0no1QCkNXIQhGCvuIDLI+GsMRrQjWootpBM0jS1lhYTV75SSYu2AJ0nFSpLMoUbC7bnmjjvuYDAY8iu/8sscd9zxozyO4aBkOBhQFAWJkeR/paSA8JSTT2Hz5s3cffddTPQmuPbaVzEx0WUwrAgBJqemMUZR1RWdTk6SaLIsYbI3yfZLL2ei1+X7t93GCSduYfv27WzatIHlpT6DYYkxBts0TE52pXWfE9GjlObUU05loruW/XP7OeWU0zj99G1MT08xvabL/PwySawHkwVrCN6zbv0MZ599JjsefZy7776HwWBIUeR0OinaKKyzOCtEU0rmU+J1Mn9ti6XgJSt4lWCrkuylNu0DtAhKm19vtHTkzHOJzxiTRPA2o64FiW/TQQRzk6yhLMtIU3EH7v7xvZxz3lmcdeaZ1JVEpPOiwPmGJElpGkuSJlRljVKKsqw4bstmLrroYoxRbN60hVNOPoVDh1aYnJyMFZfSBUdrRZbno/Sy4bDipJOOZ9u2bTRNw2XbL2fTxqNZWl4UZMM5tFFkWUa/P0QpqcEqyxqFZuvWUzhuy1FMTU5z5ZVXcsopp6K14dDBQ/iYi+JdIDGJ+ImpYXKq4KzTL+XEE4/nkYee5IUXnheOHLV9EO4SNaZQMXej5Z6mEeKlqUisEJNRg/cyr9H6phWN8XdaAmVCsBAEJA1ACJLp5INALSHmRLTgqjCb6BQJ3UvjlKZx3P/AQywsLHL55ZdJXh6O5aU+ZVzpPoSYt9HEzCSN0RlpmlIUBUXRA+VIc02Wt+2CFIPBkLquIpJRkiSSe1JXNSgdIwRw8OACztUR1O1SFBLCT1MRWRIdrqmbhl5vgsnJSTrdlLIasH9uL2XZkCSKTmeSyV6XlZUBVSnn0NpQl566cpx8ylZedsHLePzJHex47DGMkTyVTleCttY2iAUu7QtlnmWyXUT9pb1R1HExUyyEMJJ6RxogYzqsZTs5qVLRSlRSPiOEkpiN99JTycdM1pFIVYGlpRWefPIZZmfXc+YZZ1KVNXmWRh0nBCOmhTnryHNB4pNEc+DAHI889BTD4ZBHH32E55/dRbdb0DQN3U5XRG8tzvvKyhJpkpClgt/t3buHvXv3Yozi8cd3RBHVjf0tpLjBO4dWCcPhUGq9lMaYhH379rB37z6qqmbHjkeZn59HgaSwa0WWSzqb1mJECAiumJ7ucfbZZxJwPHD/w4AFJX2IxXyPKfARsWCkakApqcfzsaBPwHUB2n0IWO/lNxGcD4LSC8FClKta0mhjwqRwTdvAsj1w+16h8M7HxphgbU1RJOzatYudO1/g7HPOYNOmjWRZgbWeqelePK5CG02nUxCCTIakbcPzz7/ACzuf4fjjj2X/voP88M47R8V7zglxifqgJZxzUoL0xOPPMDc3x9atJ7F79x4OzM8TgqeuJSLsvWQEq1ijnOcZaZow6A+4774H2b17FzMzUxw4cJB9+1/EOsdgUFFXDWliSNPYfglF0c1HzvJJJ57CmWedxmOPP8qhQwukiaEcVjGRSSIarW6SEbkIg/MVIN3f2qhJQEI1LYGI732Q+ZcgaBDfQMSapAqAUF8rgzYaF3PrjFkt2gOFSQxJIhlRaWJ4/LEnOXBgL6efvg2jM6amJlheXkGBoAGJpAnIRXmUapM14dlnnyfLNddffz3r1k/z4EP3MRw2pEk66qGYmITG1mSZFP4FAkWR8cLOF/DecvGFl2NtzX333k9VldIkMuZXSuQ7kBc5RhvSNGVhYZGnnnqWqd4GLt/+CgaDZZ564hmsa5icnAACZVkRvARUtTJoBM3woWF2diPnnv0y9u7Zy7PP7pJAaF1iEpFYIcLqrWhrpRhBo5VEEdqhVMxFaXMUx1SVWJlS1iuUHFNsPnp1EjRsOUx0lVJtiY8Txdi4mJJsWOmXvLDzOYblkKM3Hxf1injvK4MltJZCgqaxNLbGe49tJF3OWsvu3TvJspTzzjufo446iuee3c2+F/eT55IvARCQiSs6BT7qpbIa8vzzTzEzs45LLr2I2dkN3P6DO+iviOWWpCkhBLIspyobiiLHWodRhoMLBzkwv5cTTjqaa6+7lm435+lnnmTx0AppJthiksR0du9BSUXnYNjHJIFOp8PJp5yCtZZnnn2awbCk08mi/rKCdtixhtORMcRKjGnfMXdGvpNo/DjBWu7ywR/uh7UEE39HhoQ4hKoie0Uk1k1Np2voD1cARZYVzM0dYG5ujsQU9CYnYzg+Yd26NdSVp9frMRiU6JhybRJDE5Hu/mCZ/fvnMIlh44ZZNm8+Gmsbdu/ZSZIYpqZ6lMMyVsRIsLStxd69+0WeeurpCDGdw/FbTuaZZ55gaWmBOiIxreHRmt8utgean59jbu4AmzZt5PTTz6Qoejzz7LPMzx8kMUbAA+/pTRiSxFCWDUppOkUH76Vp9MYNG1m3fh0H5ubYv2+O7kQ2wl2ttyODInJGtCIhBINzksDbcp7S4iCPj5bjQkswP9ZFU9gvUMXKFaMlFG9jALFTtM2vkLZzsXhBRMeA5eVFjj76KKan1mC0oao8w2GDVhnWWika9xm20aiQoZUApgfn55mb28fU1Bomp3ps27YNgMcff1w6ZseId/CSOLO86OgUBc4q5ucPcOjQPFNTPWZn17Pt9FNYXDzI0888QQgWY7JYPwZ5XmAbS5LmVHXFwqF59u/fy/R0j40b11EUGY8++giHFg6KDkITnCHEYKtENaAoUhpbU5YNGzYcxfp167j3/nuoqobEJORFh7puyDLNsFrBU5HnZowBJOZmjLhIIQTSTPSrc4Gm8pioLoxK0ErqFMToaC2U0SZV+EJMR5pIQM26hroRc1WsSE+3W4w4cGmh5uChOaam1tLtTkBscV5XljTNYnWhRqsCFTJQGUoleA+LiyvMz88zNdmj1+tw4oknYhvPnj17gUBdWZIkhZCiyQnBkaZiuAwGy9RNEwsbEo46agPWKvbtezHqCh0XnSdNJP1Mx4K65ZVFqkoSj/LCsG7dOuqq4dChgxKgRZEmOc6JqjAmqoQQcFZKkNau7bJx0yz333c/hw7Ns7xcYoyi6HSkNtzVMW0wUNV96qYa5atoo2I6hsS8JJnWEbwYVSrWrbVqR0fRihCulbOSB+9cPWqj0LYyqqqaJElxVhJiiqKgrkVMDKtFFhYP0e1IenWrF7WR9OkkET00ugClIEjp6crKMmVZs2HDBnq9SY4//ji8r1lYWGTQb2KWsWQdN4044ZJ/r1lZlrz3qalJlIL162cpioylxYGk1Hlx+htXYYwkagpO2jAcVnS7E+S5FNcdc8yxTEz0mD+wTFlKNnEagW6ltFjHweOagPcq9thXHLv5TEKALE8EhusPReyGQKfTpdspMEYc6jRNo148XKpZK66H6K8jCy3jXMbfjBSdapvxazE0QPI9pCxIfJ6iKAgq0DQV3gf6/T6gqeshg37F1NQa8jyLtVnS5L9FQpSSdj8tEAqBJEkZlkO0gunpGbz3HH30ZlCGwXCFfr9P06yGG8TE70iQT8HSYh+AtWvXoTTMzEwz0e2xtLRMVcs1KqXRGIqOOOjGGJyXMt41a9bQ63Vx1nPssccwNdXl4PxBEeHRunbRpQnRqXWxRVKWST3yluM3SkJoE0SyhECnyBgOh6Pr9vE30qlAsFpoS44Ea4z5o4QghYAyon4jEiyMKTalVtsjGJMxMdGVnLsgiaFVVRGCozcxSadTkGdS0NftCiaWZQUzM9PkuVhKjZV6ZGvdKHdQKUDLkyZQIRYNDkhS8Y+Wl1foFB0Sk7C4sEgd08had0OOJaU9IXjKaoUsS5idXYfWionuJFmWsri4OLLOqqpCKYnZGSMBRWs9dV1TFD2mpiZBwezsepLUcGhhTnSYVtRVg23syOAiYqtpksWFCbMbZ0iSnOXlZaqqoqmltrp1epvG4YNFKY2zDf2VEmstTS1mfPvEDOkSBFqLJFgdEa1fJVgUiUFhtGZ+/iALCwsURU7dWBYXFxkMBvT7ixw4cICFhUVWVvosLK5Q1w2HFpZYWFggzzM63c5q3wolF9tWhYQgyjZPpaVCCIKZSDawOIblUOqruhOpNL/0SBKqk2IDrWMeHmJi182AoujQ7UxgTEJvsoPSiv5AetMrJbnvLjQQS4KqSlK/Dx1aRGmpMVYKehPSJXth8RB5IXCScxbbeLTR+Oj8Bx9IUjluv79MCILB7t27m5WVZZSCxg4xBlBSRWobi/eWwWAgC1dHENjE9LjomxqjSdPxHPtowStIQkDKWiLhUFL1nqYFWZYwGFTcfPMXWFwYctTmWZYW+0z0JgmhITE5PkiamG0CTz7xHDt3PkdZCkcpbciynDwfRjMWrKsp0i5EPdI0DbmXlDitFGlaUHTELF6zZi179+wnTaUQcGlpiEaqQay1ZIVmOCwJQccJl0XS7XYxRrOyskzTOIpCFoa3RrAEa9FaCDEYrJCYhE63kIzhaKUtL9bRImy7fXoBrWsPiCMe4qTleUKWJsxumOGen9zNwYMreF9TNUO074IpKUtLkUurvTTJ2b13J3t27xFiqViErgJKSYaxFAcGKZMdOV+tDou8F0IEIL2nUxSsX7+ByalJ+isNu3Y9x86du3jm2ad48MEHefDBh3nwoQe4//4HefDB+3j4kfvpD5Y56cStrJ2ZHTncEgKR3EXnpPNZWTY4L6uWIJUoTdOQ5x0muh0mJrpoDb3JCVb6K6Rpio659TrqWBHfOooQJ+WrUU+IUi+kGCEiB8YYTBJQpvUnY+6gl46kiRb9DJLMWdWDWAzYtktaDdD64PFh9ZkqWktqxPq1R7Nz507uvPM2vve927j9tju55dZv8M2v3cltt93Kbbf/kNtv/z4/vPMOHn3kYRYWlkdluW2kRBvx0+RcLV0YjaT9QMUniVV1hbWKNDWx3jfnssu28+rrr2LTxi2gPMOh+Ghi0UjII0kDde1pastJJ50ItFaYLA/RO5bgA2Vds2amy8qyo1N0RdaHIKWz3QzvJPuqqixltUyaGcpSei9pYl6+yBqMMdSVGAR5kdE0Hu81WrfB1ZS6rsiyDO/EvPfeoVQSq1IighIlC0BVNeRFQlNDYsQyTHQaU880rrGkaUqaFFgrYu6YY47lPe+5EaUdZVVy8OBBAAaDQYxEiPQyWuN84Nlnn2H3rv10Ol0g0B9ICgJBgrttsFOMwdG71cQcIorRVoiYmMw/N7efk7YexzXXXMv555/L+eedz1VXvYLLtl/K9u3bueKKy7nssu1sv/Qytl96KRdccCGbNm1CxaK2pm5GwUvvZaV3uylJ27E6NnnMc8EGnQ001lGWJUuLfRSSIiYtFFo0Ruqk2ic9GCOOvm1kAfX7ksBaFB3yQuq0tDb4UNLUwkVteZBAQVJ3ppViOBzifEW3MyUF6KkkhxLTqLXSaGOkqjJoyrJieXmFouhyzrlnceGFF3HppZdx1VWv4spXvpJrr7mOa6+5hquvvkaeYHHttVxz9VVccMH5rFs/jTEyN8YkZHlsGaikFVNLJiGaiF/Be1uwEUk5TlJBmuu6oa4snaLDzJoZCW9YeZRhK1ZEnnvKSoKJugValZL4k5fs3aKQ5swmpk47Gy2u2CIoy1IGgwHLKytorVlYOMjK8hKTk9OEAJ3uKtyjFGgjhFZK45yiv7IiDSyThKXFRap6yNq1ayly6VAgN5qNFk2em1hxInoVJNQyNzdHOWzYMLtBxFWQJBrpIyIAcpqloyrONDWkiTjsRSejrsS46BQdtDZkWQfi47m0lq4JRacgTeRaQPRmUWRk2epjGsfhwfGh23BFiMn8RuuYLl2PupSVZc3S0or8QCUsLw3iySX46JwEBa21oNrunmINhtASRFayMSnWBppazqdj9UmaSvc17wNZlnBwfoGy6rP1pK1Y60mSVl+JHtGxr5NSkku/vDRgOOyjAuzdu5flpQFr181InqBtqKpKqizjCJEQglxIal6SpOzZu4eV/gpbtmwhSSR2lkbwuA0vJVo61ngv7kU2yrk30QKtokoQV8BaqWgRt0TEYmDVTWmvRxCP9rPD8cR2iFk/Up4tFALQ3kgtSLmSk3W6Od2u5Is7t9rOAEBpWW0mlsCGIKsH5GLED5LVZp1AMc6J1dbrTbJu7boovhT79h9gMBhyzjlny9P1VMvRq6M1PPIipbEldS1Jm/v276FpHMcddzxKG+pKIgPeaYKT2FpV1SgUU1Nixkstmmffvv04Zzlx6wloraka6TbaGhyK+MxP2sodadgiPp2NulAEmYn9hYmuhYpRDx07rlon8bDQdtOpBa8USfSzCBbD0io6zEopnA+j5lQhOPJcoJSylKZejC6gbW6iybOUIpeMJEHGxdBI0wznnfQPjs+rTBJJOQBRrt57ijwnTXP6/T7OWfbs2U2/v8LLXnY+KEVViiEiK1csP28lyFoUnVHboiRJOXDgAForTtl6MlkuFZFF0QFl0XECbSO6tdudpK4dw7JPf7DCvn0vYoxi3bp1OOco8gLrrIT4Y4Wk89KiECWVqmkqkqSuKhIjZnk5LPFeigONkdibMUqKCyORpIjSR26SCpkQBPFoF8iRQ3vZaySeZBXIaqmjgvZBTNeik5PlKXUtIkr2BWI2sKwUSdLxwcdKlgxnpcuagMSyhSD1U22X1Kry7N+3nxdffJHBYMj+fXOU5YDjT9iCUpqqsrGdwypI3SIHbZuHEDz9wTJ79uylLIfMzMxEyExEVJpldLsmdvqUR0RmWUp/ZYXl5SWWlhYFgJ6aITGiw6enO5RDqY+W9g0iEUTst/CdlghH1YjfmYn1mETMMI2dftqSJpAyXkZSTbqzJkkrRdqUjJ8e2ocaY+RLyfBJICQEn1DXTiwvLzpHK8nLS5IU71JCSKVVQdw/eAMhxTqpATO6g/cpWhdoMppaEUKCDxXWD1FaapknJnKpAXM1oHjh+V08uuNhpqfWM72mx/yBuZjUYklSx7BcQJuGsuqTpnLTwaUMBiWPP/4ETz31HFPTE6yZmeH5555n7doeg+ESSSJ+TpK0veI169fPYq2lHAbuv/8hnn1mJ5dccjF1Xcb0Aov3QwIOj0dJxRiCrklfRNGtgnz44AAvholWeGukIabKSPQEaTKJUqnoQ1K8D4L4eDHkMmlEORKlMmSRK6XQATFZhSVj23AlndtCCGglzUUE5xLgVkx0RQhGGoSRjDYhqpb3OolNxBLA0NTgrQLlYpxKEYJYmrOzG1m3dh1N7XnxxTmefOIZrrzyVWiVc/TRGyXCnaaCzVGNYkohBNat3UDeyZjbf5C9e/fz3HPP8cqXX4tSKXnewVqYnJSWSlVlaWzJRE/EszE5vd4EPnieePxZFhbnufDCl7Fx4yxpKt1s1q6fioBCdLpX5zD2LZFFkyQJIYpLEf8yTwSD91pyEEMKQTBK7zRaycPrfDy2iQ/91mMVmCIeI8HkrkffRdEoYYAs7UYfKgK1cYhIElF6mBuO3MSq4EMOHuW19Q12LM4jw7O8vML69RvYvPlonnzyCb75rW9w8OAC27dfztzcQSanJFLt4iOLs6yLUlIe1DSWo446lo3rj+Wxxx7l1lu/CwFe97rXURQd1s6s48CBgzjXKn2JOmdJSpoYJic7FEWPH97+Y2699VbyPOPMM85iduMMAGVZMegPV+8oRF816Fgh2RpqEoiMn8j7+DxFQXjanv+x/4cS1CaEtkPDT5HisFlsVdphZldAlk9LMG1a608O3irClmBiHYpjh1rdWkK1r/J4wdjUMpq6nW4RQx+efn+FLMs56YTT2LV7N9/85jc448xtnHXWNtavm2U4aJiensAkEtzL8w7DQTOSAhs2bODMs87goQef5Hu33sa2bWexfv1aQoClpT4TnUmMTqiqkrzQ1JVlpV9hEsNxx21hzZppvvWdr/LIow9wytZz2LBxA3P7FqiqKlqBErMLPuZsIkTzkXirm7TMa7fRM59Da1DYUcY0AL4neR8ROguHRf5XOYtxgpkYalCjNnNREWpQoW3pHTlvzKxuFX9o10Q8tuQjRCLG3xHJ1mYEeR/IcwkzCDIt3WIuuvhlzM5uIkkSXv3q61gzM8OaNT2WlpbwQbKXvPcURc7KylLsNZ+SZ122X3Yx69bO0jSOyy67TJzRvBPLaBPKYU2Iyl5rGA6lfeumjZu44GUXM7N2hrPOOpPX/fxrmJ2dReuEteumUErT7XZHVu1hBCI+Y8WKqBfYa2yLz11bna/Vnh4AJm2fbiHxwhAUPrboi1Gc0dYOnSTJqH+8j9lQLVmcb0YUFzE2zmUOFYJYPRHVVoBRKqaYCvep2MzRGAkntOchRJM3SZia6lEUGWeeeTq/+d4b+chH/pzX3HADE90u+/cfwIfA4kI/puJFKKpq3RHB5rZtO5vf/ne/yQc/+CGuvvpqNm8+ljTN6HYn6PcFPSnyjOGgptPpoJSK2byBV111Fe9///v53d/9D1x//XUR32wAzaFDB2KgNPpiLecEpDFly3GRK47c2hwQY5BHdCkvxHQebVafoi4Ih4hsYR6hwZHWvTY6GeXSy+r3uPioeR9sW2kkFzv24yjoYlhglTghFq5JXngkWETYjV4lWlU5up1CWvRpeV5JpzPBKaeewiUXX8LU5Bp6vR5pmjM12Y3hdkh0RlUFut0uCoO1AY1mzfQ6zjvvArZfcjlTU1OkaYdqWElags/iBGgG/SETve7oOdXOOo7atJHtl17KGaefwdTUGkKQWus0lQYr8tvVBRJnRDSBkmxgow1GJRglnVjbTSkwSUAnEi/TsY1uixW62AZQoDMpNVaqJfbhBAsEgaZGQbmRfxNomlgb1l5ejBSH9glywQknjemygERV5Tg+PiS0PWmraEVH1rU4sdKft8Y5x3BYjhqG1Y3FOckZaayET4T4GmsD3U6OikaETuSBPsYYecCNSqgrS9WUVGXNRE/Sva21BAR+c07yUFBqlOog9yIGkveWpnFkWRGj7CHK/dU5EYOjVQettRWtudjEGeXkAd1Keh1rE0BZvG+oY7RZOvrE5JuWtV6Cu4RgUXQZvfqAFynm86SJPN/RxZyDFtw1SRuzYRRcWz149FNU2+NJVhCs+kDidGvJSorK1R+BoSm1irUFr2OOIDIBOubvKYFwxMR3BBo8DQFp1a5UoG7KCAHJwpIKFMEAm0Z6AYvjK76P6BKYmJikLOXZzatDFnSUh/F5ChJGsq7BOhu79bSFe4q6GdI0FYPB8mqQUot8clZQo6aWZ7B472PIR+4/xIcPtYykRma9nBbvVrtLy4hBtVggMRxKQ2JrYzxo5Mm3Ha4lwURpQZ1FFMoqbN+3+7WiptWLo/cxeKeity9caQggYXZnY2s9G0W26F3n2z760qTSOilfDcFT1+XqQ22C9NAHWYSI5TV2bXI90t1aFmaaSudwAXEd1lZijo8a0ni0Cui4OEVKNYQgkW2t5aF01sUiv1jfpY1kZCltqOsG5yQ7TeJurW8m1xmCxMK0tYJmWOtG+fMSgiAG+TTGxE7RSlB3rYyEFVKZfBF7frSN37y8ruqxJBFISEWR0RIUZEWlqfTP1Ua6p2VZSlGksT+8rL4kaffTsVeUdDQ1Ruqtsiyh282Y6BV0utL/Is8TSRrKJXEmz3M6HSmH7Yw1chYJkJCmiYRN2kbOhSLvaPKOpuhkZIUh72iSFJJUSTe5jqEoJFdFmwBI7XN3IqfX65Ammk5Hzg+rJnyaSqgIpegUmqbxJEnLWWK5E2WPPMc55hAkiYCUeZ6iE/Hie5O92Hq8iRlOUiWfZZos1XJxWmJJgk4b0kxuusUbhUsECUgSLcWAo8/bWFH7txBKCCqZWkUnJS9ysizHpJ4s1xQd+TzLNWmuyQtN0UnIC4lLTfRSJiY6dDop3W5Bp5uPGjsXeU5RSDQ9TYsYGkkkNyNLyHPpvpMXGUWR0+1mdCdSOp2ETieRcxfyd9FN6U7IVnRSOhOGopvS6RqyzNDpyG97k53VloHlkMSkTE/NyKI30jZeXCKRLHkR68fGcvIB1MEDdZDVLVhdCMKm2qT83Wf+jk//Pzdxxcu30y02UzcHyTLJSzcSqadxFVplOC8ZTUZL7mGey2uIPT2IsSelpAGyiCSJGZmoJwQ4lgfNtGJhojtJXmhsI1Hlui6Z6IlZ3lpv4v3Jc7laEzxNZWH44LBWOK/T6UlEO6bNWSeluEpJSroxFhA0urE1Rqc438Rgo8TsfGhwVqSCUg3KSO+pVkooJRCf6EywtUMZiQ2uLFd0Oglap8zN7eeBBx7lHe94O29581tJ0y5z+5ZYs2aK4cAyuyFncVF0oW776mtQ+/b2QysG5ekHgsTXteU7t3yDm7/wJbLCMhw4huWAQIPROcFXWO8lTKFMfMqP9PeQZ5VYTBJwVhGQR04lqQCeTSM6BqQiJE0lPcB7j3OSgtaOLE8pig62qfDBUVYDer0eWSbPwnRWWk4ADPp9KYZr/ChgKnCQNKic6K6lsTV1fPCNIO0yvK+xzpHEWF5jLSr2ItZK2hLJWpeWfPFXlGWF0tA0deykc/jI46MntdEcnD9Ip9shzzp4L8UYb37TW3nbW9/BcVuOYmG+YWq6YGnRkeeSvUU0wLSWpBs1t28Y2tXqY7s9ie565ubm2bVrjzxyQ1uqSnoCG52RpBLLkdiUmKXGJPLckCDfKS2pZT642LAYFEZcBivRY6WDJLpE/2zVcgPQKO0xOo2hFE9ZDZnoTowynrwXh11pieza+FhF8QNXI7hZmlIUE/jgqOKDdbWW2fCuRSGkfas8TdARvJZMK6XI8mT0UIDGSoGgjsX5RLyw5bIk5miI8SVhmjRJ4jPXpGS4TTTduvU0zjjjDHq9Lk/umGPT5nU4a8gyRnXQcq1KLNMD+8ugo23urMc6uZgQwurDOYMg7Gmay9NnraLoQNOIJeODtMnTMZvXWUkv80ECfJJtG+NnwcV05Nbvi49sH3ucRhLFrY/i1DmZXKUVZVnSKSSnIuBRJLJALIAbiSPnxHwWuFR0b6cj+9qmLVqUGRb4LUj0QYcoaj3OakziURiStI17SU99CTPFsL7z8vwzLURUOmCbBB8ceS4PxUsTgwsO1yDAgnfUVYPWGWlmAM3SQl8e4K0VRksrwXbIlQb+N9TZs7cTzs18AAAAAElFTkSuQmCC
-",   # Paste Choke Base64 string here
-    "CHARGER": "iVBORw0KGgoAAAANSUhEUgAAAEMAAABOCAYAAAB7VKutAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAHsIAAB7CAW7QdT4AAC0bSURBVHhedbxnsF3Xdef523ufcMO7LyGDJAASAEGKBAmISWIAIEYRoCgr0HJbcuqyZXe7q1095Z4PM1XT9tS4uuz50DVuz1R3dVnJtqhAk7JIURQzCYAEQABEYEAgEon4gJdvOGnvPR/Wvg+gauYUDu595557ztlrr/Bf/7X2VefOzPg0TSjLnCiO6HbaDAw0cb5CG0232yaJI+I4pqoqebWOc2fPkuc5wyPDtAYGmJ6Zpd1us3DhApRS9HoZAJ12m8HBQZRWtFotTn9yjsGhAdI0Js9LhoYGuXRxgiSNGBgYYHa2zaWLE3Q6Her1GvPmj9BsNpmdaXPp0jhFUdFsNFm4aCETE5OMjAzTbDZJkpijRz9iaKjFwkULsKUHpQCFc54kibDWo3WErTzOeqrKoo2nXo8oCoc6ceyCH2i2cN7R7c3w/vvvMdBK0NrgvaeqSqrKopQizzNqtRrT023qtYRavY5C0el2sLai2WwSmQilNVobwGOtpShKtFZkWY9mcwBjDEkSoVVEZeX6RV5QbzTo9XoowBhNUZQYY0jTFG0UzkKW94gjeb6qstTSGu1OhySJQXnyrKDRrKFQeA+9Xk5RFgw0G4AiSRIWzF/I6Oh8itLS7XRpNhukaQ116sSYbzSa5HnGgYPv8jd/89ecPnMK7xTdXodGo0azMYA2isnJSYyJWLp0KefPn6fX6zHYGgSg2+tSFAVDQ0MoBVlWoYDKFjgLCxYuIMt6VFWBs5oo1oyOzOP8hbOkaYJWhkazRXu2g1JQq8WUZUVVuXC9Aq0ims2UqnKY2NDtdGm1WkxOTtNo1OhlbbzTpGlKVeVEUQQYiiJjcHCITidnYKDB1772Vb7xm99g/oKF9HoFCvmOmp7MPMrjvefgwf385f/+n5gYn+CaZddQVQVFUXHm9GmuWXYNaVpj/vz5jI+Pc+L4SZYsXcy8eaOcPHGKmdlZqrJk2bLlzMxMEycJQ4NDFEXO2MWLNOp1Vq2+nunpSeI45eiRo6xafR1lWRBFCXg4cfIEnXaXRrNBvVaj0azTbAzTbDbo9TKyLMNZD0CcRCilKIoK5xxxHJMkmsikeKDXmyGtJcwbnc9su01kYg4fPsLsTIdvfvMb/Na/+ibDwyNoZQCIogh14dy0z4sujUaDc+fO8N/++39j9arVPPHEV0jTGidPneLJH/6Ydetu5eFHHmR8fIJnnv4Xjh8/wR99+1+zaNFCfvjDH/PJx59greWee+5hYmKCVmuQ+x/YyMED73P48DHuvfceVq1ahVKOWj3hz/7sP/DlLz/Opk0bmZqaZv++gzz77C+YnJyk3khZd+s67r//fhYtWoLREUmaoFBoEpRRGONxFsrSYZ1FKU2SaIxRZHmPJI7xHrx3nDn7CX//999h547dTExM8LWvf5Xf+sY3GRkdJjIxIGatlYaq9PR6PcbGLnLk8BEuXDjPzGybDz84wgu/fIm33n6LdqdNluXseHsX7+zexYmTx2nPtpmdabN9+zYWLV5Ms9nk1KlTXLgwxokTpxi7cIl3393PJx+foiwK8izj4tg4p05+TKc9ywsvvMQnH5+mKktefe0VFi9eyF/+xV/wu7/zO0zPTPPuvv1kWY96o0FVerIsp3IlAN4pnANrLVVVUVUleV5R2RKtDNZ6nHd8cvoMhw4dZnq6zZKlixkZHSWKIrRWaB2htUEpRVVV6CSNGBkZZN68EUaGR6jXm8RxjTiKqdUT5s+fR71eB6+Ynp5hcLDFmutvRGvN+PgE586doyxLbr75RhYsWMDg4DDLli2j3Zlhz569TM9MMX/BPIaGWzhfsWDBAo4dO8mmTQ8wNTnFJ598QrvdIc9yNm3axLLly7jxhs/wW7/52zz80MMMDw+R9XpUlSWOE7yHPK/o9UqyTJyjCEP2sQsTlGWF946s1+bNN9/g+9//B5wrWbJkMc1mjSgyRFFEEkdEUYQxYiq62y6ZbXfodUtmZ7vkeYlSCqU0y5Yt4ytfeZx1627FWsfI8DAbN93HypXXMTQ0xFVXL2FiYgJbOYq8oCgrvPcsXbqE0ZFRdr3zDr1uxsaNmxgaGqHVGmRycoo9e3bT62V8/PFpXnvtTQ4fPsLU5Aznzl7g4tglzp27yNmzF7g4NsnYhQmmp9uAp5fl5HmJtx7vAaWIopg0TanVZK83EsDhXMWePe+yfftbFEXOI488wp133kEUJWRZTllWOAfee4zRxHGMjqOIWtrAO2h3elRlRVlaysphTMTsbJs8yxkeHqIsS4zWLFm6BFtVVGXFokWLmDdvPocOHaU9OwveMzw8grWOw4cOkcQpg4NDGB2TZY6PPznL3r3vcuTIYRYtXMTU1BTOea69bjm7du/kZ//yDP/4jz/kp0/9lFOnjtFotGi1hoiimCSJUQpKW4VIU2GtTID3yISNjJDnObt37+UH//APnDj5ERs23Mv69bcxOjoPZz29XkZVVThnsdbiHGI2ziPqhwJv0UahtcI70MYw0GpyzbLlDA0N0el0KKsKPKxYcS3NZpOb197Egw89yOTkNGlaY+XKlSxZspTbb7+DzVu2cMedtzEw0MBaS2QSxi9dYvWqG/mTP/lj/uiPf5+VK69jxYoVPPjgw7SaLT744EOsK1m/bh0rVqxEa01VidrHJiaKYozRaK0AghYrlBKM1etmnD5zmqeffprDhw9x+223s2XLFoaHB7HWoo0mjiPixKC1wjnxOdY6ImvdFRdMMFpjracqLc56BgeH+dxdd7Fw0QKM1tRqNZYtu4Zvfeu3mTd/FK0UDz/0ADesWUOzOcCCBfNJkpS1a29m+fJrabUGSJOULCsAz63r1jN//kIa9Rbr16/n+tVrGBoaJutVLF50Fe3OLI1GgwXzF5CmNarKUZaWvGexMSil0VqEobwHBc55wFOrJZw5c4633nqbPXv3sHLlKh555BGWLFlKUZQURUmaRgFkJRijcc7inEWh0VoZjAbvIYoM3kd4qzAmoiwsvW7BihUrGBocJooirHU0my2uX7OaqnLMzHQYHh5h/fp1LF26BKVE5ZrNJvNGR2kNDBHHqYQurZg/bwErVlwr2CCqUa8NYCtFHKfMm7eAa1es4qqlV2MtTE7OUhaWyMTByakwWaLecdyPBCXOQVnm7H13N2+9tY3ly6/mm7/9LW65ZT3Oi8lLCNUkaYJWOghRNEpp0NpoMQ2lQXk0NeIkplZLQEHWy2k0BkjiGgMDLWylaDRqOOtJ4hqRkVmfne3Qnu3S6+b0euLoiqIizwVu12r1kN+UQdUjqury59Za8rwgy3t47wBFURTkWQlekaQJ/Sf33uK8w3kf8qUI50r27n2XZ599njy3fPGLj3Hn524jjgzdrqBaYzRKaxQK6xze+6BlGvBoFZIZrQzKRygt9geaeq2J96CVwXlHu51x7NhxpqamOHt2jDRNaDTrlGVJWVY0BwYYaA3jnaHIK5QyGBPhnJdzCktZVGhtsFaR9UR1lVIkSUwcxziryHNLmtQZbI0QJxJOtVHU6glKO+IoIU1qYsrOoZTnxImj/OjJn3Lh/Bj33nsPd955B7VakyiOSeMGVVlhjBKQ5TXeiTWIMETrdF9VtInQRmEij1KS0VWVhZCgvfPOO/zgB9/nr//6P/N3f/d3fPe73+OXv3yRw4c/QqmIVquF0ZIHaK0FYgNRJAPVSouaGwPeYTQ0GnXq9TreK4rCYUxMkiSUpQXlSdNYNKQs6XUrssxRFp7SOqytSNOYNE14/71DPPXU07y7fxdrb7mBzZsfYfnyZXRmu5RlRVpL8PgQeUpsCM0y6YJSnfNoxPcAYLTCWYX3Cu89zoHC8OGho3znO9/nxRdfZnx8ikOHDvPii7/ib//2/+I73/kOu3buYnz8IihPZBKqStTcO09RZCSxIYlTUI40EdPSWvxAFMUB+Ijj8l6RJGmwcYXRIkhnHVk3k0y0m9HpdVHac+nSBZ766XO88spWrl99I5sf/RIrli+nXk9J0pgiz/EOkiSlLAqKosR7Jw5YSXpvrcM5F8xEyeDLyqONR2tIkgjvPTMzU3zyyccoLPd/4QH+6v/4K/7T//aXfPvb3+bWW9dz7twZvvu9v+e//tf/h1defoPZ2VmazQZVVbLv3fd57fVtHD/+MZ3uLL1ej7KyghnSmCSNiGMZtLUV1lnwEtbLwlJZh4kVSS2m1ogZGh4giSNqNUO9njA2NsFzv3iePe++wdXXLObrX3+Cz372NqIoIc8sUZSIGRhPHGmsC1HSl8Fh6jDpIgzzP//H//UvTASVrTh//izbtu5gyVULWbf+ZqIootFscP3qG1i1ahVpmjI+Pi44f8nV3HP3BhYtWsjJk8fZsWMnR48eZ2LyEpOTU7z+2hv84B//nnNnz7JmzUquC7hEa0NlLWVVYHRMVTniOAqa4LGVI44NaRqjQ5jPMwGDtqroZV0azZQk0bz44ks8+eSTNBpNnvj6N9i0aSODgwMURUWv1xOnqDVJGuHxnDx5kn37D7Bs2TWsXXsLtXojaIaYTeTJKMrgRE0Jukuv12ZychowxHHKxbHzbNu+nT179nDy+CdMTF1ieGiUz3/+89x115387u/8AQcOvMebW1/nqaeeCqSM5rprV7J58xbWrl1L5SrKbpckSYhiqOsGzkFkYpwF5y3WelAej8U6CZdaK0wEWkdMT4/jfM4AiqMfneSZZ55iYuIif/qn/54HHniA+fOHabcLFIo0bRJFiizrUlUWjwU8xojfUsqjQBI1QCtFpLQkxs47iqIExHENDLRYMH8BMzNddu16m61vbmNoeJiHH36Esso5d3ac3Xt2ceToh9x++118/q57Wb9+PYcOf8j58xeII8PSpVexevV1eK/odruSAMYJzrngucAHh6WUJooEQwhmcFRVRZIkwkIpzeDgMLW65vTpT3j22V9waXyczVs2s2HjvcRJTKddkWcyEbGK8F6jFHgH1nnyvMR5j0RQyUtAyT8PkULgt60cZchLvI/QWlOWFXGsWHvLrQy2Rli5ahXXrlyGUQmzsx12vbON/fsPsO/d/ezdvZ+1t9zMbbd/luuvv5GjR47xzjvvMjZ2gUceeZQ1a9agtWZ2tkuaCuUngSwIAzUX862tKMtCBBaoQ609rVad6elxXn75JbZt28oNN6ziq1/5CitWXM3sTE5ZlDhnJZ3wISooGan4hkpgvOrfV4ShUHgUurIW7z0qMD4g/EZZWKamZsnziptuuoHNWx5l9erVFD1Hr9tjoDnIo198jD/543/LH/zB77F8xTXs3/8u/+N//Hf+y3/5P/nRD3/CsY+OEpmEwcEWWnuyLKMsC4wRTw7ivHyA1dpoiSqAcy4gYi9wWXkmJyd44Ve/4tVXX2d0dD5f+cpXuP761WQ9h/IRJopJ0lrAEh7nhPgFRRSJySsl15fkTs7xQWi6LCzWiu2kaSqxu2YwxlCr1YiihE67pN0OnEKU0Ky3AmFb0WwM8MADD/Af//x/4dt/9G+49+4N3HjDZ9i46T5+//f/kK997WssXLiETqckigWP5LmjsiKEfl7UF0CfqBECRlOWJVGkyfMe27fv4Jmnf44xEZs3P8rNN92CcxGdTpe0lpDECUmcEqcJIM7XefERURQRxWYOW/QFMocrFGiPR2mN0RHeK5QyxFGKMUmI9zI7SulAs1VUTmBwVVUBcjtGRlts3LiRP/zDf8uf/fs/50//3b/hsS1bWLx4qeQA3oBXkr1GCh04E5kpBSEFlwxVhNRPs7OsYP/+g7z80uv0egWbNm1i48YNtFqDWFuhlQjOORcsQIEX9ddKCcJU/XteIQ0uW4tSCi2gJxYAYhW2UlRVEZIfj7Xgnccg0Fobg8dTWUdViQr247XSinojYqA1QKNRJ4qjQNcVlGWBrTw++E5UmBHkQVCCBFUgbJxzlGWJ9/Dxxx/z4q9e4vSZE9y34fPcc8/djM5bIGROvY7SUFWibZWTnAUVBqglQXNWSbTq3y+UEvo+FBQatBzgck6ilJFZCzNmTALKCFKzDlc5FJrYJOC1QOTCCvL0hnqtQa3WQGktyVQpKqmNIo4SbKUASY6qSiJYf8Yk7MlnUaSZnZnhzTffZP+BfVxzzbVs3LCJq5ZeQ5lLdKhKIYOtC4N08szeC7hWCpwV8pgQQoURV/K5lsmUzwjSQSPPoNFKoHJfhZVSeOWxlThacT5INNBaTACFCurpLFQl2MpjrSJNEur1JooET4RCslajxWmXZUme55RliQ15R62W4Kxlz97d7HpnB0uXLmbDhvtYce21pGkNUFQV9HoF3ho0mshISi/RAdwcaSz+yRiFCw7ZOx/Mo68pHgnEoic4q4Q/9GIi/egkOiyaI3mLBq/nnJ+JxC6VjkQ4QcAehTGKOE2Ik4Q4itBKwlhVVTjv0FquY62lLEuKogAl8Pzgwfd5+eWXyLIuDz74AHfddSe1Wh1rHUkSE5lIoLSXcCrKddknqLn3/XxL/laBrvDezflPRDNkoP3Ne4NWki32vxwMMFxw7lQUYkoiCJGriBPhC5zHaEOkI7yDorDYEDL7dJvWUs2q1WrEsWikc4r33vuAZ575OWfOnOWuO+9m3br1jI6O4kNiRT8O+Aij05Bk9rUcNEGrw2t/QkHQ7pWAS8YiDjbMeDioS8pK0lw3513EFvuaQDCd/kXkllrSdC/ScKG4SwhhRV7Q7XYpiwqjVQh1kgzmeY7WmsHBAer1OmdOn+LZZ5/l0OEPuXXdWh599BEWLV4c1F3jHFSVcBlCERiUkUTsysm6vAUhOD0nEMVlR6qVkD5awmlQ63AhVwnJApdDD33V/7W7XTany965T8F/+juSnkuYhSSOaTZSwNPptCnLHBMpOp0Jtm59g917drFi+QoefOARli9fIaHd+Tmqrywr8JooliJ0/56//nySgchmjLsiiol5SjFJEwn6FTW68ho6KlG44CH7m3yprxGEGe+/XrkLqnSAIDwQjqJeT4njiLyoKCsLgWmq1erUaimddsGBAwfZuXMnAwODPPTwF/jMjTdSVX6O/jMmDsy4gCljpHpmK48JRPGnNk/QBgXKzGmy0pcjidZK3jtn8V4evj+LtuwDMPAER4NUw/u0YN8i+ibT30U+ogX991oL41VLI6IIiqLA2pJOt4fHMTTUJE0Np0+f4OVXXuHSxSnuuP1ObrnlVurNGp4Sayucl8yzf0+tQeHx3mKtQ2nJevtSUCrs2qO1QymLUoK2xXkKM46yoBza2gLrCryvAIvzFSrqouMKZSSyWJ/LyZEnihXKiDBkJgRF9neZrQiQkNYXhLWWvBAQFcWKOIF2exJre3hVcfrMx2zd9iY7d+7ghs9cx5e+9BgLFy7BexgcHAypgQ4TI36uKkust5jIYIyAKu+dZMLKoo3DxBUmqtDGorU8H0BZChAs8oyyzENNxZgQ7xUoh9ERkTGYQIt9ymnAnBbRR5L/P5sxBm003itBh5XF4zGRFHG6nR7OWxqNOpMTU/z858+ydetWbr7pJrZs3sxVVy0lSSKq0tJp5yHSSPcNfeen+g68vwnQ6m/eITWgqiLPc4pCBi2JX0gFlBaA5hCfofpprY9EtQOen8sb+rcTawEPjr5Z/X/tIkCtEbDmg6mFmooxmjgxtFpNLl4c56233uK1114nzwu2PLaFO++4g1qtPne9fgju03OXtytFIa++/6VwSEzXA0JR5HkZGHWNiSK0jgRIAnpu0J4AuCqMFg8tYbfvcuTinss3+3XHedn3hIf2DpxDB/rNaIXHUdkShcbomJ07d/CTn/wYgEcf/SJ33HY79XqDLBPyNo6lhOA9eHcZ6CmumMSgxeJDwjMGeC3CN8RxElB1iB4mDrsgYaMNuo/cRHpWYu4VEUNCj5m7oXx2BXkyt/XNSQTTd74QZkjLe0nAcrSGDz78gF8+/wJnz1zgrrvu4QtfuJ9Gc5CiuCxsZMZw1hPFhiiSppJAS4gWI2MIf8rn4Q+lpFIonT3SlxH3r6MlqgQVQvdnW2ZTXSZb8HMxWGsp682F1pB+X2Gsn9pUuInWWszEShOJtWUoDTrGJyZ57rlf8NFHJ7j/gY089NCDjI6MUlUOF7JXcXYaaxFMqUxAiXN3Ep29wpIjY4hiOeackyQt1GJBCKS+kAgsmrUV3jm02Bh4FNZKXtAPkTIxwUzmbE+0RS4mr0pdvhlKwpvSkrMYA85XlGWJ8xalhA1/9dVX2bFjNzfddBNffvw3WHP99SRJgvOSuleVRSEJGF4GYZ3D9otec5jHh8kUbYxjuacUjSzWVaEgNqenKCRhq8LEOOdFGPLm8li8E3KlX1yxlThKEEdmrZVBBlUU7bk8W3NC83IDsGgNcWxoNKShJIoUr732KosXL+LxLz/O1VevQGsjlbRQN8FLxuk8Qkk6BV4H5Cj30aHH01ZWqAUndR/vwIb6rSBki3Mlfk7rLwNNMf0g4CCsuU2bOEQRAAEsXkl2N+cgnfRLoUSKfeeJFtMyWoRqK8vMTJs8LxkYqFOvxyhVsHv3OyhlePzxLdxxx21UVcnMTBvnBUm6QEPKDClQGseVCaW8+vCf6IZocllJOqC1oFPnHGVRzLVR2kq6egR0iTYJHJWUDrQcVEpqCCB/izmECn0gYJQKM2alEm69xc5lgeHieEpb4pWj0ajRaNTQWjM722PPngM8+aMnue222/j85++lFsoAjWadZrMWBiuaMefIvYT0cAsIjth7D5qAGeTEPHdY6yURjCTFz7KSsiw+lSYE7AaXHQFaJBS8sIkgFFv6UUPuJl8yJiKOEvlMB4/tPc5WWFvgbEVlC4qywAV+IkkiokiTZQWnz5zl588+z4EDB7j99nUMtkYYGxunVk+ppSlFLlxrFEcB7xvhTeaiRZiqfigXfZGJRBx7VZRY54Q6MFrggnOUVYV1jqrf9oS/LNwgYO2dx1mH9+JAL5cOwgk6OJzQwhxFEUppNMJ7zmEO56iqQtiqqgxJkPSQl2VJlvXYvn0rO3Zs5ZprljE0NIL3jjRtEEUJ7dmc2dkZUKB1RGT6HTr95OtTPNRcSwFBcwUrKUA0Rgas0DrCRFJUN1pjVCyCC48uzJdEMC2h50rb73vScNdwd2fDOTiKUma/qkq5iNIhZAF4dBiIqL6U+Q4ePMiPfvRjer2cxx9/jFo6QJYVNJsD2MoTJ4bBwUGSRMCR1tKS2M99tJg1SpQRjwA61XeC4fM+uV1Z6RwWwFUnScRUtVFCRF2BrwTZerS7ogvGu1B4cXYue+9DcufEAZVlRbfTodPuURaFCMMIopNETVOrpdJuVFVo7Tn60VGeffZfKPIeWzZv5oH77xfaLpLZzvOMJAkdvsEHaNMXgkLrvj8KDjXgIu9Fa7UKCBmPiSRNlwUAFUYbajWhHUXDkJA9Bx8cDieVOBmzDjUFaQ9wvsJ7G0JPP113WFdJic5YlLZ4VaGUAyWhqygyvLdo7fBY8jzn2LGTPP3PP+O9999ny2Ob+ea3/hWLFi8gjhNqaQJeURaKbsfRni0oy74zJwxebL4P8eW5Qm3FgIkUUSTn+wDW6DN3XoauVIDcRgJBOCzhv2/m3qONTjAqFaRXxigfERkpw/mAFcRfKsEMBhqNBq3BOmkqaC/Pe0zNjHP+wmmmpsfpdGfpdtsURcbbO97i7bd3cvPNa3n8S1/h6quuptspiExKXiiKvKJWk46dRqMugwrZoEdsObwL6mxxTugGrSFKILR/S1+nc4GITjAmFprQgncRUmCvxOEgjH8/QmolrCkosRsV9YgTg1ISn314kL70VEhy+rtzHq3A2op2e5Y861JVhdRSyop9+w6wc8dOli2/hocffoj58+eTZRXGRKS1GrrPf2iDs9In0U8a50JncJp9vyS2LqHQOU9VeWwVtCAw81du/UDQfzU6CfcQ5I3oTrhHQIzeOxT9tB0IRWG5UN/WLmeNOvRjVpUMrtUaZnh4HoODI6RpwslTJ/nZz37GufPn2HDfPdx++zpMFHq0ryBZdKiDet8nkAXQzQkj+IU5LBB4S1TQBCt9HQowoSn+yq0fD/pC7X/cPwwhWZvTjHCyqxKMTkKVXL4yJ4jgsfsne6QMYK2jXq8xMDDA0NAIaVLjww8/5Pnnn+PM2dN87q7P8bnPf45ms0VVSkvA7GyXLMullBAZotiABuuF8fYuaGNAlxIGPV5JuLxyfFJ08jh/GSReuf3an8ExC+T34Tv9PEeLk5QqWpyWgevsm0U4KZzcR239GSlD8VkpKRbVajVmZqZ548032PfuAW5ZezOPPfYoCxYspKq81EVDLuBD7cPoMNtIRc57qe1677FOhFO5iirAextw0Nw0B782Bwl+bfv04SCs4Gx9QJtzUUvgqTxUFKVYq6lKJRHmyrRdFBjnXFBNaYuULpsimIxl//79vP/++yy9aiFfuH8TK1ZcS1VKv3mtlqCUp9VqktYSoiSSMBgG0zfBED1FI/r13VB2lIgmTp1Q7/CEpFBi5ZWjv2wW3gHin1TgY+Z8YThXUnj8HGhRupxjmLWW9qa5kBVyArFnaDZrNJvSY+ms4+hH7/P8L39FURQ8/PAj3HrruoBXxC90Ol26vZ4QxUYTGS3VNys451PCCFtIwa6w8vAqDi8cE4fgkNHPDXZOM+QYIRgo1beGPgkkV9B98AJC3s4JRwlXaStpDTKhTyOKIozWpIGsbTTr1NIax44f5adPPcWFcxM8/PCjbNzwBZrNJtZ6Bgbq1FLRAjE9g7dgK8ktdD+M+8CF+LnxBeFcsYeS5q/PLgrMFQLyIbuWccgJUlKoUEpaO5NEVijI+f5yFta/Zr8O6b3wGVpHpGmMcyV5LmtVk6SfiUr99OLYRX7+85+z792D3HHXTWzccA8LFsxDK0O9nmKimCwvUdpQSxtSBVe+X+kVAwxJlHMSXlWIcuJQZWCEWdVXtDrZShLCqqqo7BVp+dzWR9ViilKilGv0UW5fY4Qdv8JIjZZEjCCtPl9oraxt1VphXUW7kxHHKVNTU/zi+efZum0rS5Ys5p6772XhwkX0ejllaYW9co5uNwM8SRLP+R4ZrGAgrbSQslf4DFGGPoFriKOYJBISd86pexkwwRg+9f9c2VRgW18Q/XMFKvRFFnCG3DxcMAiiPzPgKQqL95p6vQFekfW6zMxM47EcPXKIZ597moULF/H7v/d70vNZWWZmZqjCQh1hvPqtyRajonBcMIVHaEJJ8EKpr1+c0lqy2Fh6sgQJ9/1Hv0RoiExEHImiB6sPpiGa4YNwr9w+9bcPqwpU/wL94k9oHayqiiyTpRIyG4a8yInimFqtzsenTvPKK6+TZzkb7ruPtWtvJUlq1Go1hodHieMkrDv1JImsXc2znDiJiBPpF/fBRCRaSPePRlRYHJyQ1EVe0ssyWadWFNLmGMyCYNbOiyN3zkvjTJjjvjaYgDGCbc4JCfg10HWltJXUIMSWQtjTkgkCNJsDTE5O8t3vfp/t29/ivvs28tBDjzA0JEufskxYJa2DXVuHMVK08aFLNzIao0SPnbNzpuOcA325DVIcojDseZZJh08hfeZ9nODxWO8oqz6JY3H9ahd9X6PF+Qazm8vOncN7Mf+gGWJl/S2KAeWJ44h6PUHrfj+ELH3qdDr88pe/YPeeHdx9z+d4dPMXGR4ZprIVSkvPpVy3n8PIIMX/xFjrKcqKorJzZFJkDEkaSe9n4FeiWPq+0zQmqcUkSUoUiZDiJCFNk7kOHqWUwHjrcFbalPqBAAVae1n/EsVzjll2UQKtlDBdog0iCPG4FVVZoLVDa4+1OWWVESea6ekp3njzZV597SWuXXEdX/2N32TVys9gTES9XptbtG+MRmsTKnPSP9HvrMkzi8JRlj3a7UnGLp7l0sR5JibOc2n8HBcunmFs7Axjl85xafwcM7MXmZq+wPTMRS5dusT5CxfodtphvbsSDiMkcyYCW1XB/KrAfIVoBBgdowJLJ/0iwYMrhzrz8awfaNWw1rF9+3b+7v/+W+6++06e+PoTjM4bFr6hEsZIoXjxxVf4p3/6MWkt5ne/9a/53F13YSKNx9Fq1ShyR1WVxEn86bYnj6ivlTR8ZH6NC+cv8t7Bg+zZu5eyLIPDgzgSn3J59ixVVaIUUk4A1q1bx/Wr17BixUqiKMU7RVl4UJasW1BrJkSRdBN6pBVh+/a3+NGPfsKmjffxpS89zsDAIHlehknTElq9V9hKFspYK5VqE0lmGcWGJJaerH379vHcc79AkfClLV/mzrtuYWCwHgo1FdZ6klRUsb9sYc4Mr+AOlJIaSNbrcebMad577z3eeWcXO3a8zc6db7N79x727N7Dvnf3sXfvHl555VW2b3+bffsO8MGH77F//16OHz9Bt9eTzgEDaU0mpMhLabhTAhCrShrrJUyHiQl+sb/36cXIeVmy6ZFag/dBCFEUOoQ1RWE5fPhDnn76Gc6cPs/XnvgyDz20kfmjo/Tyaq6gm2U5SZIQx+aKcBailTco5dFKYZ2sJ63VG6xevUo6b+aaZsAYCZfiy6DX62KMoV5v0uu1GbtwiZtvvokVy68migztdodGo4FSEg2TJMb5kjyXJeJpaiiDz5OVVlJb+VQ0waNDGQGtBVkmcX0OAZZlwexsm4mJcXbu3Mm+/ftYc+O13HnHnQyPDJPllqyXoZQiMoayrOaWaQBhcLLLMYcPHUBZVtBpz3Lk6Ee8ufVNXn31FbZt28bOnTt57bXXeemll3jppZf51a9eZOvWbbz88qu8/PJLbH/rLQ6+v5+JiQlQhqpU0qBfSZmisgXe24BJmGttAIsxkGeaquoL5DIydc5fDq1SKBKhiHORldAzMzNs3bqVHTt3cMMNN/LEE7/JkiVLyXpWllEFksXj56JIlhXkeR5I2QCVQ2my7wO8q2g0U5yrmJy6RFVJU2y322Fs7CKzs9NYW5LnPbK8S7s9y9mzp5mcmMBaS6/XZWpynCxrB/Uv6XYypqbHOXfhDL1slm6vTb0RkRcZvV5Gp9PFuSLwqQLN+9EEIFJK2qX7oKesJJbLSj/HsWPHeOGFFyiKnCee+Cq33rqWyDSkMRZHrSbOFzzGJEHK4rD64bVvKs4p0RIPk5PTLFw8wuYtj0pDvLOkScLAwAC9Xo+RkRGuvnopExOTXLo0wfz581EabAnj4xeZnZ3l1dde5+qrr2HF8usoyxGKMuPDQwf46OhJRkaGMRE88OD91NKUWq0OSqF0jjGX8xethYtxzqONNuhIWKZe1qEoCpRylGXBwYMHee655xgbu8jdd3+edetu/RThY630SaWpNJQIladIkkjo+VhyCFmdGGGMCENpGBxq4L1n/NI47767l1+98AIvvfQSR44c5dDhw5w/NyY9oWdO8/rrbzB24RKrV61ieGSIp595mueef45jx47ygx98jx//5Ekqm/Ozn/0zzz33HHv2vs1LL73I008/w+lPzmIiTVqT3gxnE2HLg9M0xgQI79HWWdIU0kTATr1Wo9FocvrMGX705E/YtWsnGzduZPOjm0mTAdIkFhBWlIEMlk48j7DWWgvQKYo8NJFlodKWU5YZ09PjzM5OEScx7dlZjh8/QaPRZMuWzdx///3cccftOGt5c9sbHDl6lBMnT0nbZKMmjtZKK9IXH/kif/7n/xP3P3A/hw9/yJkzn0hP2Nqb+eu/+c/89d/8FQ8++BD1eo16vSErIpTBRCVRbEK01NKtHLoNtAlNaFGiGBkdZWRkHlXl2PH2Lvbu28P1169hw4b7uOaaq0mSmMnJNlXlpPIVGeLYgHL0em26vTbOVZRVSV7kwoPEGhMplHKyGrLRoLQZly5dpF6v0+602bVrBy+++DJvvPEmU9NTLF++nFqtxu539vDBBx+weMkiVq5cQavVYGhoiKVLl5BlGXESs2njBi6Nj3HkyCHa7WnWrr2RZrPB4NAA169ZRVmWjF+cIe85KYHQxFpHVUq7tveCodI0Rqe1GkUBRe5pDTTIsoyDBw+ya9cO5o3O49FHt3DVVVfR6fSo1+VXSYzRFGVBr9ul2+3hrKXRaDAQfnYK70jThFq9RpKkeC8lybyQLuCylN/niiLDggXzeeyxL/GFL2yiKHPGL41zww03sHjxYl559VVmZma47tplNAfqWFsxNjbGhfMXIPAZZ8+epV5r8JnPrGHevFGOHjlGkZe8994H7N69G+c8rVaLKBIQGMUlClkAJCuqpSjebncFjme9HO+hXq/Ty3p89NFROp0eG+67j9vvWEccx/KzUrbAGBPYIk9zoE6jmcz1Wintcb4iig1xYuh228xOT5Fl7QCboTVYZ/78Yay1dLpdhoaGATh69KisSC4LanXBN2VZsHr19Vy/Zg1VVTEzO0OcxAwNt5iaGuftt99m1zu7Wb/+swwMDLDmhhvYufMddr3zDs89+wtOHD9BWRZcvHiJdrsbqn45RSEVOWHT5ZeYGo06UVVJBSbLcs6cucjMzCxVVTE6OoqJEg4eOEC93go5hdRI+mW6ouxRryeYSJNnFUpp4lj6PkEogCSp4bHUaw2yrAvKU5UVWZYzODSIc3Do0CFOfXyK2z57GwsWzKfTaTM02OKGNTcwMjzM+++9RxzLz8nEScrAwADf/d73cNZx663r2LxlMx8dO86G+zbw06f+me9/7wdMTExw0003c+bMGS5cuAR43jtwiDyrqMKPFlnbZ/elsUWdPjXj6/WUbq/L9m3b+Id/+i5jY+cxRjjCXq9DkqY4C0VuGZ03glIR09NTRBHEiaEqLb1ejzRNabUGyPKMIhc02hxoMTs7w8BAi5mZScEZVsxm3rx5LF9+LXmWc/HSGFpp8iKnXq9RFCW1tA54Ot1O+I0uR61eZ3RkHuMTF0mTlDiJaTabXDh/gYULF5IXOd1OR36IxDq6nS5p2hAAOZ3jfcyXf+MRvvGNr7N48ZJgbgLA1McnJ3ytVqPXa3P0oyPs37+XqalJiiJHa6H7KlvhrOCIwcERbAnWZ4yMtJidmWVmdop6vU6W5Zw9e46jHx2mXq9xyy23Mjo6n3379lKv1xkaGmTRwoWYKGLv3r1zv9eTpgndbpfTn5zm+InjOCcdxYsWLmZkZJhjx49R5AXeKxYsnM8N19/IwGCDOIopy4I4kaXiRSHLOKIoCguDFXlW0Gy2KApLlnWIzQC33XErd911F62BIXTgVsqyQp35ZNInaUS9luC9I8sFoUVR4CIs9LKe9FCE5lSlFGma4JyllxV4X9BqNXj//UNs3bqNox8dYXCwxRe/+Aj1ep0nn3ySRQsXsXnzo6xceR1nz53lu9/9Pvfeey8bN9wnzriXcerkx7z99tt88MEhpmemWbNmDQvmL+C9996jqkqazRbLVyzn9ttvZ/36tcRxQlVKY0xZlmE1tXQPaKVoNFp0Olmo5EnSZq2b+5mZLC/A+8DI5fy/BNZpIyHDUeIAAAAASUVORK5CYII=
-"  # Paste Charger Base64 string here
-}
-
-def get_symbol_image(sym_name):
-    """Converts Base64 string to a ReportLab-ready image"""
-    b64_str = SYMBOL_DATA.get(sym_name)
-    if b64_str and len(b64_str) > 50:
-        img_data = base64.b64decode(b64_str)
-        return ImageReader(io.BytesIO(img_data))
-    return None
-
-# --- CONSTANTS ---
-PAGE_MARGIN = 20
-SAFETY_OFFSET = 42.5
-FIXED_GAP = 33
-PAGE_SIZE = landscape(A3)
-ROW_HEIGHT_SPACING = 105 
-
-# --- CORE FUNCTIONS ---
-
-def parse_multi_sheet_txt(raw_text):
-    sheets_data = []
-    current_meta = {"sheet": 1, "station": "", "location": "", "sip": "", "heading": "TERMINAL CHART"}
-    current_rows = []
-
-    for line in raw_text.splitlines():
-        line = line.strip()
-        if not line: continue
-        upper_line = line.upper()
-        
-        if upper_line.startswith("SHEET:"):
-            if current_rows:
-                sheets_data.append({"meta": current_meta.copy(), "rows": current_rows})
-                current_rows = []
-            val = re.search(r'\d+', line)
-            if val: current_meta["sheet"] = int(val.group())
-        elif upper_line.startswith("STATION:"):
-            current_meta["station"] = line.split(":", 1)[1].strip()
-        elif upper_line.startswith("LOCATION:"):
-            current_meta["location"] = line.split(":", 1)[1].strip()
-        elif upper_line.startswith("SIP:"):
-            current_meta["sip"] = line.split(":", 1)[1].strip()
-        elif upper_line.startswith("HEADING:"):
-            current_meta["heading"] = line.split(":", 1)[1].strip()
-        else:
-            parts = [p.strip() for p in line.split(',')]
-            if len(parts) >= 2:
-                rid = parts[0].upper()
-                middle_part = ",".join(parts[1:])
-                last_part = parts[-1].upper()
-                term_keywords = ["SPARE", "RESERVED", "NI", "E3", "TERMINAL", "BLOCK", "LINK", "RESERVE", "SP"]
-                is_cable = not any(key in last_part for key in term_keywords)
-                cable_detail = last_part if (is_cable and len(parts) >= 3) else ""
-                
-                pattern = r'([^,\[]+)\[\s*(\d+)\s+to\s+(\d+)\s*\]'
-                matches = re.findall(pattern, middle_part, re.I)
-                for match in matches:
-                    func_text = match[0].strip().upper()
-                    start, end = int(match[1]), int(match[2])
-                    
-                    # Detect Symbol from Function Text
-                    detected_sym = None
-                    for sym_key in SYMBOL_DATA.keys():
-                        if sym_key in func_text:
-                            detected_sym = sym_key
-                            break
-
-                    for i in range(start, end + 1):
-                        current_rows.append({
-                            "Row ID": rid, "Function": func_text, 
-                            "Cable Detail": cable_detail, "Terminal Number": str(i).zfill(2),
-                            "Symbol": detected_sym # Storing the detected symbol
-                        })
-    if current_rows: sheets_data.append({"meta": current_meta, "rows": current_rows})
-    return sheets_data
-
-def draw_group_line(c, x1, x2, y, is_top=True):
-    c.setLineWidth(0.8)
-    c.line(x1, y, x2, y)
-    tick_size = 5 if is_top else -5
-    c.line(x1, y, x1, y - tick_size)
-    c.line(x2, y, x2, y - tick_size)
-
-def draw_page_template(c, width, height, footer_values, sheet_num, page_heading):
-    c.setLineWidth(1.5)
-    c.rect(PAGE_MARGIN, PAGE_MARGIN, width - (2 * PAGE_MARGIN), height - (2 * PAGE_MARGIN))
-    c.setFont("Helvetica-Bold", 16)
-    c.drawCentredString(width / 2, height - 60, page_heading.upper())
-    
-    footer_y = PAGE_MARGIN + 60
-    c.line(PAGE_MARGIN, footer_y, width - PAGE_MARGIN, footer_y)
-    total_footer_w = width - (2 * PAGE_MARGIN)
-    info_x = PAGE_MARGIN + (total_footer_w / 15)
-    c.line(info_x, PAGE_MARGIN, info_x, height - PAGE_MARGIN)
-    
-    remaining_w = total_footer_w - (total_footer_w / 15)
-    box_w = remaining_w / 7 
-    dividers = [info_x + (i * box_w) for i in range(8)] 
-    for x in dividers[:-1]: c.line(x, PAGE_MARGIN, x, footer_y)
-
-    headers = ["PREPARED BY", "CHECKED BY", "CHECKED BY", "APPROVED BY", "LOCATION NO / GOOMTY / RR", "STATION", "SIP", "SHEET NO."]
-    
-    for i in range(8):
-        x_start = PAGE_MARGIN if i == 0 else dividers[i-1]
-        x_end = dividers[i]
-        x_c = (x_start + x_end) / 2
-        c.setFont("Helvetica-Bold", 9.0)
-        c.drawCentredString(x_c, footer_y - 12, headers[i])
-        val = f"{sheet_num:02}" if i == 7 else str(footer_values[i])
-        
-        if i in [4, 5, 6, 7]:
-            c.drawCentredString(x_c, PAGE_MARGIN + 30, val.upper())
-        else:
-            c.drawCentredString(x_c, PAGE_MARGIN + 5, val.upper())
-    return info_x
-
-def process_multi_sheet_pdf(sheets_list, sig_data):
-    buffer = io.BytesIO()
-    width, height = PAGE_SIZE
-    c = canvas.Canvas(buffer, pagesize=PAGE_SIZE)
-    
-    fs = {'head': 10.0, 'foot': 9.5, 'term': 8.5, 'row': 12.0}
-    
-    for sheet in sheets_list:
-        meta = sheet['meta']
-        df = pd.DataFrame(sheet['rows'])
-        df['sort_key'] = df['Terminal Number'].apply(lambda s: int(re.findall(r'\d+', str(s))[0]) if re.findall(r'\d+', str(s)) else 0)
-        df = df.sort_values(by=['Row ID', 'sort_key'])
-        
-        f_vals = [sig_data['prep'], sig_data['chk1'], sig_data['chk2'], sig_data['app'], meta['location'], meta['station'], meta['sip'], "AUTO"]
-        info_x = PAGE_MARGIN + ((width - (2 * PAGE_MARGIN)) / 15)
-        term_per_row = int((width - info_x - SAFETY_OFFSET - 40) // FIXED_GAP)
-        
-        y_curr, rows_on_page, current_sheet_no = height - 160, 0, meta['sheet']
-        draw_page_template(c, width, height, f_vals, current_sheet_no, meta['heading'])
-        
-        for rid, group in df.groupby('Row ID', sort=False):
-            terms = group.to_dict('records')
-            chunks = [terms[i:i + term_per_row] for i in range(0, len(terms), term_per_row)]
-            for chunk in chunks:
-                if rows_on_page >= 6:
-                    c.showPage()
-                    current_sheet_no += 1
-                    draw_page_template(c, width, height, f_vals, current_sheet_no, meta['heading'])
-                    y_curr, rows_on_page = height - 160, 0
-                
-                x_start = info_x + SAFETY_OFFSET + 20
-                c.setFont("Helvetica-Bold", fs['row']); c.drawRightString(x_start - 30, y_curr + 15, str(rid))
-                
-                # Draw Terminals
-                for idx, t in enumerate(chunk):
-                    tx = x_start + (idx * FIXED_GAP)
-                    c.setLineWidth(1); c.line(tx-3, y_curr, tx-3, y_curr+40); c.line(tx+3, y_curr, tx+3, y_curr+40)
-                    c.circle(tx, y_curr+40, 3, fill=1); c.circle(tx, y_curr, 3, fill=1)
-                    c.setFont("Helvetica-Bold", fs['term']); c.drawRightString(tx-8, y_curr+17, str(t['Terminal Number']).zfill(2))
-                
-                # Draw Functions, Cable Details, and Symbols
-                for key, is_h, y_off in [('Function', True, 53.5), ('Cable Detail', False, -13.5)]:
-                    i = 0
-                    while i < len(chunk):
-                        txt = str(chunk[i][key]).upper().strip()
-                        sym_type = chunk[i].get('Symbol') # Get symbol name from row
-                        
-                        if not txt: i += 1; continue
-                        start_i, end_i = i, i
-                        while i < len(chunk) and str(chunk[i][key]).upper().strip() == txt: end_i = i; i += 1
-                        
-                        s_x, e_x = x_start + (start_i * FIXED_GAP), x_start + (end_i * FIXED_GAP)
-                        mid_x = (s_x + e_x) / 2
-                        
-                        # DRAW SYMBOL
-                        if is_h and sym_type:
-                            img = get_symbol_image(sym_type)
-                            if img:
-                                # Adjust position (y_curr + 42) to sit nicely above terminal
-                                c.drawImage(img, mid_x - 10, y_curr + 42, width=20, height=20, mask='auto')
-
-                        draw_group_line(c, s_x-5, e_x+5, y_curr + y_off, is_top=is_h)
-                        c.setFont("Helvetica-Bold", fs['head' if is_h else 'foot'])
-                        text_y = y_curr + y_off + (12 if is_h else -20)
-                        c.drawCentredString(mid_x, text_y, txt)
-                        
-                y_curr -= ROW_HEIGHT_SPACING
-                rows_on_page += 1
-        c.showPage() 
-    c.save(); buffer.seek(0); return buffer
-
-# --- UI LOGIC ---
-
-st.title("🚉 CTR Generator with Auto-Symbols")
-
-with st.sidebar:
-    st.header("✒️ Signature Names")
-    sig_data = {
-        "prep": st.text_input("Prepared By", "JE/SIG"), 
-        "chk1": st.text_input("Checked By (SSE)", "SSE/SIG"), 
-        "chk2": st.text_input("Checked By (ASTE)", "ASTE"), 
-        "app": st.text_input("Approved By (DSTE)", "DSTE")
-    }
-
-uploaded_file = st.file_uploader("📂 Upload Drawing Content (.txt)", type=["txt"])
-
-if uploaded_file:
-    raw_text = uploaded_file.getvalue().decode("utf-8")
-    st.session_state.sheets_data = parse_multi_sheet_txt(raw_text)
-
-if 'sheets_data' in st.session_state and st.session_state.sheets_data:
-    sheet_names = [f"Sheet {s['meta']['sheet']}: {s['meta']['location']}" for s in st.session_state.sheets_data]
-    sel_idx = st.selectbox("Select Sheet to Edit", range(len(sheet_names)), format_func=lambda i: sheet_names[i])
-    
-    # Data Editor allows manual correction of Symbols
-    curr_rows = st.session_state.sheets_data[sel_idx]['rows']
-    edited_df = st.data_editor(pd.DataFrame(curr_rows), num_rows="dynamic", use_container_width=True)
-    st.session_state.sheets_data[sel_idx]['rows'] = edited_df.to_dict('records')
-
-    if st.button("🚀 Generate PDF Drawing", type="primary", use_container_width=True):
-        pdf = process_multi_sheet_pdf(st.session_state.sheets_data, sig_data)
-        st.download_button("📥 Download PDF", pdf, f"CTR_Drawing_{datetime.now().strftime('%d%m%Y')}.pdf", "application/pdf", use_container_width=True)
\ No newline at end of file